@@ -9,18 +9,22 @@ from ttkbootstrap.constants import *
 from tkinter import filedialog, messagebox, simpledialog
 from tkinter.scrolledtext import ScrolledText
 import threading
+import functools
 import os
+import queue
 import sys
 import subprocess
 import urllib.request
 import math
 import time
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import pandas as pd
-import requests
 
 import numpy as np
 
@@ -46,43 +50,16 @@ from allone import updater
 import webbrowser
 
 translations = {
+    # tr() falls back to the key itself, so English only lists entries whose
+    # text differs from their key.
     "en": {
-        "Combined Utility Tool": "Combined Utility Tool",
-        "Welcome to the Combined Utility Tool!": "Welcome to the Combined Utility Tool!",
-        "File & Image Tools": "File & Image Tools",
-        "Utility": "Utility",
         "menu.utility": "Utility",
         "menu.utility.rugno_formatter": "ID Column Formatter",
         "menu.utility.bulk_size_processor": "Bulk Dimension Processor",
         "menu.utility.single_size_calculator": "Quick Dimension Calculator",
         "menu.utility.unit_converter": "Unit Converter",
-        "Code Generators": "Code Generators",
-        "Help & About": "Help & About",
-        "Language": "Language",
-        "English": "English",
-        "Turkish": "Turkish",
-        "Compact Mode": "Compact Mode",
-        "Zoom": "Zoom",
-        "Advanced Settings": "Advanced Settings",
-        "Show Sidebar": "Show Sidebar",
-        "Hide Sidebar": "Hide Sidebar",
-        "Update Available": "Update Available",
-        "Update": "Update",
-        "Auto-update on startup": "Auto-update on startup",
-        "Speak scanned barcode": "Speak scanned barcode",
-        "Speak digits individually": "Speak digits individually",
-        "Scan speech feedback:": "Scan speech feedback:",
-        "None": "None",
-        "TTS (OK/Error)": "TTS (OK/Error)",
-        "Beep": "Beep",
         "UpdatePromptMessage": "A new version ({version}) is ready to install. Unsaved work will be saved automatically.",
         "UpdatePromptCountdown": "Updating automatically in {seconds}s…",
-        "Update now": "Update now",
-        "Update cancelled.": "Update cancelled.",
-        "Preparing update…": "Preparing update…",
-        "Update in progress…": "Update in progress…",
-        "Update failed, try again later.": "Update failed, try again later.",
-        "Unsaved work saved automatically before update.": "Unsaved work saved automatically before update.",
         "UpdateStatus.Idle": "Update status: Idle",
         "UpdateStatus.Checking": "Checking for updates…",
         "UpdateStatus.UpToDate": "Up to date (v{version})",
@@ -91,414 +68,36 @@ translations = {
         "UpdateStatus.Preparing": "Preparing update v{version}…",
         "UpdateStatus.Error": "Update check failed: {error}",
         "UpdateStatus.Timeout": "Update check timed out. Possibly offline.",
-        "Updated to v{version}": "Updated to v{version}",
-        "Setup / Install Dependencies": "Setup / Install Dependencies",
         "SetupMissingPackagesPrompt": "Missing packages detected: {packages}\n\nInstall now?",
         "SetupMissingModulesFrozen": "This build is missing required modules. Please install the latest version.",
         "SetupRunning": "Dependency setup is already running.",
-        "Sections": "Sections",
-        "Automatic compact mode enabled for small screens.": "Automatic compact mode enabled for small screens.",
-        "Language changed to {language}.": "Language changed to {language}.",
-        "1. Copy/Move Files by List": "1. Copy/Move Files by List",
-        "View in Room": "View in Room",
-        "Google Maps Scraper": "Google Maps Scraper",
-        "Search Term": "Search Term",
-        "Location": "Location",
-        "Max Listings": "Max Listings",
-        "Headless": "Headless",
-        "Include Socials/Email": "Include Socials/Email",
-        "Start": "Start",
-        "Stop/Cancel": "Stop/Cancel",
-        "Export Excel": "Export Excel",
-        "Export CSV": "Export CSV",
         "Progress": "Progress: {value}/{total}",
-        "Ready": "Ready",
-        "Starting scrape...": "Starting scrape...",
-        "Starting Google Maps scrape...": "Starting Google Maps scrape...",
-        "Scraper already running.": "Scraper already running.",
-        "Search term is required.": "Search term is required.",
-        "Stop requested.": "Stop requested.",
-        "No active scrape to stop.": "No active scrape to stop.",
-        "No data to export.": "No data to export.",
-        "Saved: {path}": "Saved: {path}",
-        "Source Folder:": "Source Folder:",
-        "Target Folder:": "Target Folder:",
-        "Numbers File (List):": "Numbers File (List):",
-        "Browse...": "Browse...",
-        "Browse": "Browse",
-        "(Select)": "(Select)",
-        "Image Files": "Image Files",
-        "All Files": "All Files",
-        "1. Choose Excel File": "1. Choose Excel File",
-        "2. Columns": "2. Columns",
-        "Width:": "Width:",
-        "Length:": "Length:",
-        "Load Mapping": "Load Mapping",
-        "Save Mapping": "Save Mapping",
-        "Create File": "Create File",
-        "Select Excel File": "Select Excel File",
-        "Excel Files": "Excel Files",
-        "Excel file could not be read: {error}": "Excel file could not be read: {error}",
-        "{count} columns loaded.": "{count} columns loaded.",
-        "Please choose an Excel file first.": "Please choose an Excel file first.",
-        "Missing Fields": "Missing Fields",
-        "Please map the following fields:\n{fields}": "Please map the following fields:\n{fields}",
-        "Size (Width/Length must be selected)": "Size (Width/Length must be selected)",
-        "File could not be saved: {error}": "File could not be saved: {error}",
-        "Missing Required Cells": "Missing Required Cells",
-        "Some required cells are empty. See below for details.": "Some required cells are empty. See below for details.",
-        "Missing fields: {fields}": "Missing fields: {fields}",
-        "All required fields look filled.": "All required fields look filled.",
-        "Inventory Macro": "Inventory Macro",
-        "Macro Settings": "Macro Settings",
-        "Excel Column Name:": "Excel Column Name:",
-        "Start Delay (seconds):": "Start Delay (seconds):",
-        "Entry Delay (seconds):": "Entry Delay (seconds):",
-        "Start Macro": "Start Macro",
-        "Macro already running.": "Macro already running.",
-        "Give focus to the target input field!": "Give focus to the target input field!",
-        "Macro starting in {n}s...": "Macro starting in {n}s...",
-        "Macro finished successfully.": "Macro finished successfully.",
-        "Macro failed or aborted.": "Macro failed or aborted.",
-        "How to Use": "How to Use",
-        "Keep your inventory application open on the side.": "Keep your inventory application open on the side.",
-        "Select the Excel file and choose the correct column.": "Select the Excel file and choose the correct column.",
-        "Quickly click inside the input field of your target application before the countdown ends.": "Quickly click inside the input field of your target application before the countdown ends.",
-        "JSON": "JSON",
-        "Mapping could not be saved: {error}": "Mapping could not be saved: {error}",
-        "Mapping saved as {filename}.": "Mapping saved as {filename}.",
-        "Mapping could not be loaded: {error}": "Mapping could not be loaded: {error}",
-        "Mapping {filename} loaded.": "Mapping {filename} loaded.",
-        "Width × Length": "Width × Length",
-        "Copy Files": "Copy Files",
-        "Move Files": "Move Files",
-        "Save Settings": "Save Settings",
-        "2. Convert HEIC/WEBP to JPG": "2. Convert HEIC/WEBP to JPG",
-        "Folder with HEIC/WEBP files:": "Folder with HEIC/WEBP files:",
-        "Convert": "Convert",
-        "3. Batch Image Resizer": "3. Batch Image Resizer",
-        "Image Folder:": "Image Folder:",
-        "Resize Mode:": "Resize Mode:",
-        "By Width": "By Width",
-        "By Percentage": "By Percentage",
-        "Max Width:": "Max Width:",
-        "Percentage (%):": "Percentage (%):",
-        "Font Size (pt):": "Font Size (pt):",
-        "Sale Price Size (pt):": "Sale Price Size (pt):",
-        "MSRP Size (pt):": "MSRP Size (pt):",
-        "JPEG Quality (1-95):": "JPEG Quality (1-95):",
-        "Resize & Compress": "Resize & Compress",
-        "Room Image:": "Room Image:",
-        "Rug Image:": "Rug Image:",
-        "Resize Rug (%):": "Resize Rug (%):",
         "Yere Yayma (%):": "Floor Spread (%):",
-        "Rug Transparency:": "Rug Transparency:",
-        "Lay Rug (90°)": "Lay Rug (90°)",
-        "Generate Preview": "Generate Preview",
-        "Save Image": "Save Image",
         "Manual Place Rug": "Manual Place (4 Points)",
-        "Draw Foreground Mask": "Draw Foreground Mask",
-        "Open Large Preview": "Open Large Preview",
-        "Close Preview": "Close Preview",
-        "Brush Size": "Brush Size",
-        "Brush Mode": "Brush Mode",
-        "Paint (Hide Rug)": "Paint (Hide Rug)",
-        "Erase (Reveal Rug)": "Erase (Reveal Rug)",
-        "Clear Mask": "Clear Mask",
-        "Preview will appear here.": "Preview will appear here.",
         "View in Room Controls": "Canvas controls: Left click and drag to move, mouse wheel to scale, right click and drag to rotate.",
-        "Please select both room and rug images.": "Please select both room and rug images.",
-        "Could not open selected images: {error}": "Could not open selected images: {error}",
-        "Preview image saved to {path}.": "Preview image saved to {path}.",
-        "No preview available. Please generate a preview first.": "No preview available. Please generate a preview first.",
         "Manual Prompt 1": "Distort Mode: Click the top-left corner where the rug should sit on the floor.",
         "Manual Prompt 2": "Click the top-right corner where the rug should sit on the floor.",
         "Manual Prompt 3": "Click the bottom-right corner where the rug should sit on the floor.",
         "Manual Prompt 4": "Click the bottom-left corner where the rug should sit on the floor.",
         "Manual Placement Complete": "Rug placed. You can drag, scale, or rotate.",
-        "IDENTIFIER TOOLS": "IDENTIFIER TOOLS",
-        "DIMENSION & MEASUREMENT TOOLS": "DIMENSION & MEASUREMENT TOOLS",
-        "ID Column Formatter": "ID Column Formatter",
-        "Excel/CSV/TXT File:": "Excel/CSV/TXT File:",
-        "Format": "Format",
-        "Quick Dimension Calculator": "Quick Dimension Calculator",
-        "Dimension (e.g., 5'2\" x 8'):": "Dimension (e.g., 5'2\" x 8'):",
-        "Calculate": "Calculate",
-        "Bulk Dimension Processor": "Bulk Dimension Processor",
-        "Excel/CSV File:": "Excel/CSV File:",
-        "Column Name/Letter:": "Column Name/Letter:",
-        "Process File": "Process File",
-        "Status": "Status",
-        "ID": "ID",
-        "Column Match & Report": "Column Match & Report",
-        "Primary List:": "Primary List:",
-        "Reference List:": "Reference List:",
-        "Compare IDs": "Compare IDs",
-        "Results:": "Results:",
         "RUG_NO_CONTROL_FOUND": "Found",
         "RUG_NO_CONTROL_NOT_FOUND": "Not Found",
-        "Please select both Primary and Reference lists.": "Please select both Primary and Reference lists.",
         "Primary List Tooltip": "The main list to be checked.",
         "Reference List Tooltip": "The list to compare against.",
         "Compare IDs Tooltip": "Compare ID values across both sheets.",
-        "Could not find a Rug No column in the selected file.": "Could not find a Rug No column in the selected file.",
-        "Could not read the selected file: {error}": "Could not read the selected file: {error}",
-        "Rug No control completed.": "Rug No control completed.",
-        "Export Report": "Export Report",
         "Export Report Tooltip": "Export comparison results to an Excel file.",
-        "No results to export.": "No results to export.",
-        "Unit Converter": "Unit Converter",
-        "Centimeters (cm):": "Centimeters (cm):",
-        "Inches (in):": "Inches (in):",
-        "Feet (ft/in):": "Feet (ft/in):",
-        "Conversion:": "Conversion:",
-        "182 cm to ft": "182 cm to ft",
-        "8. Match Image Links": "8. Match Image Links",
-        "Source Excel/CSV File:": "Source Excel/CSV File:",
-        "Image Links File (CSV):": "Image Links File (CSV):",
-        "Key Column Name/Letter:": "Key Column Name/Letter:",
-        "Match and Add Links": "Match and Add Links",
-        "8. QR Code Generator": "8. QR Code Generator",
-        "Data/URL:": "Data/URL:",
-        "Output Type:": "Output Type:",
-        "Standard PNG": "Standard PNG",
-        "Dymo Label": "Dymo Label",
-        "Dymo Size:": "Dymo Size:",
-        "Bottom Text:": "Bottom Text:",
-        "Filename:": "Filename:",
-        "Generate QR Code": "Generate QR Code",
-        "9. Barcode Generator": "9. Barcode Generator",
-        "Data:": "Data:",
-        "Format:": "Format:",
-        "Output Type:": "Output Type:",
-        "Generate Barcode": "Generate Barcode",
-        "Rinven Tag": "Rinven Tag",
-        "Single Tag Setup": "Single Tag Setup",
-        "Single tag preview updates as you type.": "Single tag preview updates as you type.",
-        "Collection Name:": "Collection Name:",
-        "Design:": "Design:",
-        "Color:": "Color:",
-        "Size:": "Size:",
-        "Origin:": "Origin:",
-        "Style:": "Style:",
-        "Content:": "Content:",
-        "Type:": "Type:",
-        "Rug #:": "Rug #:",
-        "Area:": "Area:",
-        "Include Barcode": "Include Barcode",
-        "Price:": "Price:",
-        "Sale Price:": "Sale Price:",
-        "MSRP:": "MSRP:",
-        "SKU:": "SKU:",
-        "File Naming Order:": "File Naming Order:",
-        "Excel Row Order (1, 2, 3...)": "Excel Row Order (1, 2, 3...)",
-        "Column Value (Rug#, SKU...)": "Column Value (Rug#, SKU...)",
-        "Bulk Tag Generation": "Bulk Tag Generation",
-        "Output Format:": "Output Format:",
-        "Tag Data Excel File:": "Tag Data Excel File:",
-        "Output Folder:": "Output Folder:",
-        "Standard PNG (Color)": "Standard PNG (Color)",
-        "Dymo Label (B/W)": "Dymo Label (B/W)",
-        "Bulk labels will use this size when Dymo is selected.": "Bulk labels will use this size when Dymo is selected.",
-        "Include Barcode from Excel": "Include Barcode from Excel",
-        "Generate Tags From Excel": "Generate Tags From Excel",
-        "Download Sample Excel": "Download Sample Excel",
-        "Save Sample Excel": "Save Sample Excel",
-        "Sample Excel saved to: {path}": "Sample Excel saved to: {path}",
-        "Sample Excel could not be saved: {error}": "Sample Excel could not be saved: {error}",
-        "Select Folder": "Select Folder",
-        "Selected file does not exist.": "Selected file does not exist.",
-        "Could not create output folder: {error}": "Could not create output folder: {error}",
-        "Starting bulk Rinven tag generation from: {path}": "Starting bulk Rinven tag generation from: {path}",
-        "Include Only Filled Fields": "Include Only Filled Fields",
-        "Live Preview": "Live Preview",
-        "Barcode Data:": "Barcode Data:",
-        "Generate Rinven Tag": "Generate Rinven Tag",
-        "Preview unavailable": "Preview unavailable",
-        "Barcode data missing; barcode will be skipped.": "Barcode data missing; barcode will be skipped.",
-        "Font not found, default font used.": "Font not found, default font used.",
-        "Barcode could not be rendered and was skipped.": "Barcode could not be rendered and was skipped.",
-        "Unable to render Rinven preview.": "Unable to render Rinven preview.",
         "Barcode support": "Barcode Support",
-        "Barcode support is unavailable.": "Barcode support is unavailable.",
-        "Barcode feature requires additional libraries.": "Barcode feature requires additional libraries.",
-        "Nothing to export yet. Add at least one field.": "Nothing to export yet. Add at least one field.",
-        "Rinven Import Sheet Generator": "Rinven Import Sheet Generator",
-        "Paste RugNo List": "Paste RugNo List",
-        "Scan RugNo/Barcode:": "Scan RugNo/Barcode:",
-        "Load Excel/CSV": "Load Excel/CSV",
-        "Select Image Folder": "Select Image Folder",
-        "Fill Images": "Fill Images",
-        "Auto Size/Area": "Auto Size/Area",
-        "Auto Price": "Auto Price",
-        "Bulk Set Origin": "Bulk Set Origin",
-        "Bulk Set Style": "Bulk Set Style",
-        "Export Rinven Excel": "Export Rinven Excel",
-        "Export to Wayfair Format": "Export to Wayfair Format",
-        "Export Complete: {total_rows} items processed, {missing_images} missing images, {missing_style} missing style values.": "Export Complete: {total_rows} items processed, {missing_images} missing images, {missing_style} missing style values.",
-        "Active Image Folder:": "Active Image Folder:",
-        "No RugNo values found.": "No RugNo values found.",
-        "Imported {count} RugNo values.": "Imported {count} RugNo values.",
-        "Select RugNo Column": "Select RugNo Column",
-        "Please choose the RugNo column to import.": "Please choose the RugNo column to import.",
-        "Import failed: {error}": "Import failed: {error}",
-        "Pricing Multipliers": "Pricing Multipliers",
-        "SP Multiplier:": "SP Multiplier:",
-        "Retail Multiplier:": "Retail Multiplier:",
-        "MSRP Multiplier:": "MSRP Multiplier:",
-        "Save Pricing": "Save Pricing",
-        "Pricing settings saved.": "Pricing settings saved.",
-        "Please enter a value.": "Please enter a value.",
-        "Updated {field} for {count} rows.": "Updated {field} for {count} rows.",
-        "Auto size applied to {count} rows.": "Auto size applied to {count} rows.",
-        "Auto pricing applied to {count} rows.": "Auto pricing applied to {count} rows.",
-        "Please select rows to update.": "Please select rows to update.",
-        "Please select an image folder first.": "Please select an image folder first.",
-        "Fill Images completed for {count} rows.": "Fill Images completed for {count} rows.",
-        "Could not parse cost value.": "Could not parse cost value.",
-        "No file selected.": "No file selected.",
-        "Export completed: {path}": "Export completed: {path}",
-        "Export failed: {error}": "Export failed: {error}",
-        "Enter value to apply:": "Enter value to apply:",
-        "RugNo Column:": "RugNo Column:",
-        "Image folder updated.": "Image folder updated.",
-        "Added {count} RugNo rows.": "Added {count} RugNo rows.",
-        "Scanned RugNo added: {value}": "Scanned RugNo added: {value}",
-        "RugNo already exists: {value}": "RugNo already exists: {value}",
-        "No RugNo values were added.": "No RugNo values were added.",
-        "Unable to read file: {error}": "Unable to read file: {error}",
-        "Please enter valid multipliers.": "Please enter valid multipliers.",
-        "Map this field": "Map this field",
-        "Compliance Panel": "Compliance Panel",
-        "Export Only Mapped Fields": "Export Only Mapped Fields",
-        "Export Compliant File": "Export Compliant File",
-        "Field not selected.": "Field not selected.",
-        "Mapping not selected.": "Mapping not selected.",
-        "Width and Length must be selected.": "Width and Length must be selected.",
-        "Contains empty cells.": "Contains empty cells.",
-        "Load an Excel file to evaluate compliance.": "Load an Excel file to evaluate compliance.",
-        "Enable mappings to begin validation.": "Enable mappings to begin validation.",
-        "All required fields mapped and filled.": "All required fields mapped and filled.",
-        "Required fields needing attention:": "Required fields needing attention:",
-        "Export cancelled: missing required mappings.": "Export cancelled: missing required mappings.",
-        "Export cancelled: required fields contain empty values.": "Export cancelled: required fields contain empty values.",
-        "No fields selected to export.": "No fields selected to export.",
-        "Export summary: {rows} rows | {fields} fields exported | Skipped: {skipped}": "Export summary: {rows} rows | {fields} fields exported | Skipped: {skipped}",
-        "None": "None",
-        "Print Generated Tags": "Print Generated Tags",
-        "No generated tags found to print.": "No generated tags found to print.",
-        "Printed {count} tag(s) to the default printer.": "Printed {count} tag(s) to the default printer.",
-        "Printing tags failed: {error}": "Printing tags failed: {error}",
-        "Please fill in all Rinven Tag fields.": "Please fill in all Rinven Tag fields.",
-        "Barcode data is required when barcode is enabled.": "Barcode data is required when barcode is enabled.",
-        "Filename is required.": "Filename is required.",
-        "win32print is only available on Windows.": "win32print is only available on Windows.",
-        "win32print module could not be loaded. Please check the pywin32 installation.": "win32print module could not be loaded. Please check the pywin32 installation.",
-        "Check for Updates": "Check for Updates",
-        "Warning": "Warning",
-        "Information": "Information",
-        "OK": "OK",
-        "Cancel": "Cancel",
-        "Source and Target folders cannot be empty.": "Source and Target folders cannot be empty.",
-        "✅ Settings saved to settings.json": "✅ Settings saved to settings.json",
-        "Success": "Success",
-        "Folder settings have been saved.": "Folder settings have been saved.",
-        "Error": "Error",
-        "Please specify Source, Target, and Numbers File.": "Please specify Source, Target, and Numbers File.",
-        "Please select a valid folder.": "Please select a valid folder.",
-        "Please select a valid image folder.": "Please select a valid image folder.",
-        "Resize values and quality must be valid numbers.": "Resize values and quality must be valid numbers.",
-        "Please select a file.": "Please select a file.",
-        "Please enter a dimension.": "Please enter a dimension.",
-        "Invalid Format": "Invalid Format",
-        "W: {width} in | H: {height} in | Area: {area} sqft": "W: {width} in | H: {height} in | Area: {area} sqft",
-        "Please select a file and specify a column.": "Please select a file and specify a column.",
-        "Please fill in all file paths and the column name.": "Please fill in all file paths and the column name.",
-        "Scanner Comma Joiner": "Scanner Comma Joiner",
-        "Scan Input (Auto-adds comma):": "Scan Input (Auto-adds comma):",
-        "Joined Text:": "Joined Text:",
-        "Copy Text": "Copy Text",
-        "Clear Text": "Clear Text",
-        "Export to TXT": "Export to TXT",
-        "No text to export.": "No text to export.",
-        "Text exported to {path}.": "Text exported to {path}.",
-        "Text Files": "Text Files",
-        "Text copied to clipboard.": "Text copied to clipboard.",
-        "Data and filename are required.": "Data and filename are required.",
-        "Error: {message}": "Error: {message}",
-        "Network Printers": "Network Printers",
         "NETWORK_PRINTERS_DESCRIPTION": (
             "Discover printers shared over your LAN. Select a local or remote printer "
             "and send files through the AllOne Tools print service."
         ),
-        "Select Printer:": "Select Printer:",
-        "Refresh Local Printers": "Refresh Local Printers",
-        "Printer File:": "Printer File:",
-        "Browse File": "Browse File",
-        "Send Print Job": "Send Print Job",
-        "Discovered Network Printers": "Discovered Network Printers",
-        "Printer Name": "Printer Name",
-        "Host Computer": "Host Computer",
-        "IP Address": "IP Address",
-        "Port": "Port",
-        "Origin": "Origin",
-        "Local": "Local",
-        "Remote": "Remote",
-        "No printers available.": "No printers available.",
-        "Please select a printer.": "Please select a printer.",
-        "Save PNG": "Save PNG",
-        "Print Dymo": "Print Dymo",
-        "Print Preview": "Print Preview",
-        "Label Size:": "Label Size:",
-        "Preview unavailable.": "Preview unavailable.",
-        "Print": "Print",
-        "No file generated for printing.": "No file generated for printing.",
-        "Rinven tag sent to printer.": "Rinven tag sent to printer.",
-        "Please select a file to print.": "Please select a file to print.",
         "PRINT_JOB_SENT": "Print job sent successfully.",
         "PRINT_JOB_FAILED": "Failed to send print job: {error}",
         "DISCOVERY_UNAVAILABLE": "Printer discovery service unavailable.",
-        "Printer backend unavailable.": "Printer backend unavailable.",
-        "Network printer discovery is not available on this platform.": "Network printer discovery is not available on this platform.",
-        "Select a file to send to the printer.": "Select a file to send to the printer.",
-        "Support & Donate": "Support & Donate",
         "DONATION_MESSAGE": (
             "Thank you for using AllOne Tools! If you would like to support ongoing development, "
             "you can send a BTC donation using the address below."
         ),
-        "BTC Address": "BTC Address",
-        "Copy Address": "Copy Address",
-        "Donation address copied to clipboard.": "Donation address copied to clipboard.",
-        "Close": "Close",
-        "Color Palette": "Color Palette",
-        "Dominant Color Extractor": "Dominant Color Extractor",
-        "Select Image:": "Select Image:",
-        "Extract Colors": "Extract Colors",
-        "Top 5 Dominant Colors": "Top 5 Dominant Colors",
-        "Hex Code": "Hex Code",
-        "RGB Value": "RGB Value",
-        "Color Name": "Color Name",
-        "Live Color Picker": "Live Color Picker",
-        "Move mouse over the image to pick a color.": "Move mouse over the image to pick a color.",
-        "PDF Tools": "PDF Tools",
-        "Convert from PDF": "Convert from PDF",
-        "Convert to PDF": "Convert to PDF",
-        "Merge & Split": "Merge & Split",
-        "PDF to Word": "PDF to Word",
-        "PDF to Excel": "PDF to Excel",
-        "PDF to PNG": "PDF to PNG",
-        "PDF to JPEG": "PDF to JPEG",
-        "Word to PDF": "Word to PDF",
-        "Excel to PDF": "Excel to PDF",
-        "Image to PDF": "Image to PDF",
-        "Merge PDFs": "Merge PDFs",
-        "Split PDF": "Split PDF",
-        "Compress PDF": "Compress PDF",
-        "Select PDF File": "Select PDF File",
-        "Select Word File": "Select Word File",
-        "Select Excel File": "Select Excel File",
-        "Select Multiple PDFs": "Select Multiple PDFs",
-        "Convert Now": "Convert Now",
         "ABOUT_CONTENT": (
             "AllOne Tools - v{version}\n"
             "A unified desktop workspace for file, image, data, and labeling workflows.\n"
@@ -1017,8 +616,78 @@ translations = {
 }
 
 
+# Single-level view of ``translations`` keyed by "<language>\x00<key>" so a
+# lookup is one hash instead of two chained ``dict.get`` calls.
+_FLAT_TRANSLATIONS: Dict[str, str] = {
+    sys.intern(f"{language}\x00{key}"): value
+    for language, table in translations.items()
+    for key, value in table.items()
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _about_content(language: str) -> str:
+    """Return the Help & About text for a language, formatted once."""
+    template = _FLAT_TRANSLATIONS.get(f"{language}\x00ABOUT_CONTENT", "ABOUT_CONTENT")
+    return template.format(version=__version__)
+
+
+@functools.lru_cache(maxsize=None)
+def _font_spec(family: str, size: int, weight: Optional[str] = None) -> tuple:
+    """Return a shared font tuple so identical fonts are allocated once."""
+    if weight:
+        return (family, size, weight)
+    return (family, size)
+
+
 RUG_NO_CONTROL_COLUMNS = ["Rug No", "RugNo", "RugNo#", "SKU", "Sku"]
 
+FONT_UI = "Segoe UI"
+FONT_UI_SEMIBOLD = "Segoe UI Semibold"
+FONT_MONO = "Cascadia Code"
+FONT_TEXT = "Helvetica"
+
+# (text_key, row, column, sticky) for the static labels of the code generators.
+QR_LABEL_LAYOUT = (
+    ("Data/URL:", 0, 0, "w"),
+    ("Output Type:", 1, 0, "w"),
+    ("Dymo Size:", 2, 0, "w"),
+    ("Bottom Text:", 2, 2, "e"),
+    ("Filename:", 3, 0, "w"),
+)
+BARCODE_LABEL_LAYOUT = (
+    ("Data:", 0, 0, "w"),
+    ("Format:", 0, 2, "e"),
+    ("Output Type:", 1, 0, "w"),
+    ("Dymo Size:", 2, 0, "w"),
+    ("Bottom Text:", 2, 2, "e"),
+    ("Filename:", 3, 0, "w"),
+)
+
+LOG_FLUSH_INTERVAL_MS = 50
+LOG_AREA_MAX_LINES = 2000
+BACKGROUND_WORKERS = 4
+SETTINGS_SAVE_DELAY_MS = 500
+UPDATE_CHECK_CACHE_S = 3600
+RINVEN_HISTORY_LIMIT = 10
+
+SCANNER_SPEECH_DEFAULTS = MappingProxyType({
+    "enabled": False,
+    "speak_digits": True,
+    "feedback_mode": "none",
+})
+
+UPDATE_STATUS_KEYS = MappingProxyType({
+    "idle": "UpdateStatus.Idle",
+    "checking": "UpdateStatus.Checking",
+    "timeout": "UpdateStatus.Timeout",
+    "error": "UpdateStatus.Error",
+    "up_to_date": "UpdateStatus.UpToDate",
+    "update_available": "UpdateStatus.UpdateAvailable",
+    "auto_installing": "UpdateStatus.AutoInstalling",
+    "preparing": "UpdateStatus.Preparing",
+})
+
 
 class ScrollableTab(ttk.Frame):
     """Wraps a frame within a canvas to provide per-tab scrolling."""
@@ -1129,7 +798,7 @@ class Tooltip:
         self.text = text or ""
         self.background = background
         self.foreground = foreground
-        self.font = font or ("Segoe UI", 9)
+        self.font = font or (FONT_UI, 9)
         self.delay = max(0, int(delay))
         self._tipwindow: Optional[tk.Toplevel] = None
         self._label: Optional[tk.Label] = None
@@ -1148,7 +817,7 @@ class Tooltip:
             self._show(event)
             return
         try:
-            self._after_id = self.widget.after(self.delay, lambda e=event: self._show(e))
+            self._after_id = self.widget.after(self.delay, self._show, event)
         except tk.TclError:
             self._after_id = None
 
@@ -1217,17 +886,22 @@ class Tooltip:
         if not self.text:
             self._hide()
 
-DYMO_LABELS = {
-    'Address (30252)': {'w_in': 3.5, 'h_in': 1.125},
-    'Shipping (30256)': {'w_in': 4.0, 'h_in': 2.3125},
-    'Small Multipurpose (30336)': {'w_in': 2.125, 'h_in': 1.0},
-    'File Folder (30258)': {'w_in': 3.5, 'h_in': 0.5625},
-}
+# Label sizes map a display name to a (width_in, height_in) tuple.
+DYMO_LABELS = MappingProxyType({
+    sys.intern('Address (30252)'): (3.5, 1.125),
+    sys.intern('Shipping (30256)'): (4.0, 2.3125),
+    sys.intern('Small Multipurpose (30336)'): (2.125, 1.0),
+    sys.intern('File Folder (30258)'): (3.5, 0.5625),
+})
 
-RINVEN_DYMO_LABEL_SIZES = {
-    'Portrait 4" x 2.3" (Default)': {'w_in': 2.3, 'h_in': 4.0},
+RINVEN_DYMO_LABEL_SIZES = MappingProxyType({
+    sys.intern('Portrait 4" x 2.3" (Default)'): (2.3, 4.0),
     **DYMO_LABELS,
-}
+})
+
+# Combobox values / defaults, built once instead of per panel build.
+DYMO_LABEL_KEYS = tuple(DYMO_LABELS)
+RINVEN_DYMO_LABEL_KEYS = tuple(RINVEN_DYMO_LABEL_SIZES)
 
 
 @dataclass
@@ -1241,8 +915,17 @@ class RugWarpResult:
 class ToolApp(ttk.Window):
     """Main application window that builds the entire tkinter interface."""
 
+    # Whether tk.Text accepts disabledforeground/background; probed on first use.
+    _text_disabled_colors_supported: Optional[bool] = None
+    # Style maps, layouts and colour options only depend on the palette, so
+    # setup_styles installs them once.
+    _static_styles_installed = False
+
     def __init__(self):
         super().__init__(themename="superhero")
+        # Keep the window unmapped while it is built so Tk lays it out once,
+        # when it is shown at the end of __init__, instead of after each pack/grid.
+        self.withdraw()
 
         # --- Fix for Window Icon in Exe ---
         icon_path = get_resource_path("icon.ico")
@@ -1253,31 +936,29 @@ class ToolApp(ttk.Window):
                 print(f"Warning: Could not set icon: {e}")
         # ----------------------------------
 
+        # Pending lines beyond what the log widget keeps would be trimmed on
+        # insert anyway, so the buffer drops the oldest ones instead of growing.
+        self._log_buffer: "deque[str]" = deque(maxlen=LOG_AREA_MAX_LINES)
+        self._log_flush_pending = False
+        # Reused daemon workers for run_in_thread. Daemon threads are not
+        # joined at exit, so a running task never keeps the process alive.
+        self._task_queue: "queue.Queue[Optional[Tuple[Future, Callable, tuple, dict]]]" = queue.Queue()
+        for index in range(BACKGROUND_WORKERS):
+            threading.Thread(target=self._run_background_tasks, name=f"allone-bg-{index}", daemon=True).start()
         self._pending_update_metadata = {}
 
 
         self.settings = load_settings()
+        self._settings_save_after: Optional[str] = None
         self.settings.setdefault("rinven_history", {})
         rinven_import_settings = self.settings.setdefault("rinven_import", {})
-        settings_updated = False
-        if "image_folder" not in rinven_import_settings:
-            rinven_import_settings["image_folder"] = ""
-            settings_updated = True
-        pricing_settings = rinven_import_settings.setdefault("pricing", dict(DEFAULT_PRICING))
-        for key, default_value in DEFAULT_PRICING.items():
-            if key not in pricing_settings:
-                pricing_settings[key] = default_value
-                settings_updated = True
         scanner_speech_settings = self.settings.setdefault("scanner_speech", {})
-        if "enabled" not in scanner_speech_settings:
-            scanner_speech_settings["enabled"] = False
-            settings_updated = True
-        if "speak_digits" not in scanner_speech_settings:
-            scanner_speech_settings["speak_digits"] = True
-            settings_updated = True
-        if "feedback_mode" not in scanner_speech_settings:
-            scanner_speech_settings["feedback_mode"] = "none"
-            settings_updated = True
+        # Fill missing defaults in one pass; the file is only rewritten when
+        # a key was actually added, so an already-migrated launch costs no write.
+        settings_updated = self._fill_missing(rinven_import_settings, {"image_folder": ""})
+        pricing_settings = rinven_import_settings.setdefault("pricing", {})
+        settings_updated |= self._fill_missing(pricing_settings, DEFAULT_PRICING)
+        settings_updated |= self._fill_missing(scanner_speech_settings, SCANNER_SPEECH_DEFAULTS)
         if settings_updated:
             save_settings(self.settings)
         self.rinven_import_settings = rinven_import_settings
@@ -1307,6 +988,9 @@ class ToolApp(ttk.Window):
         self.language = self.settings.get("language", "en")
         if self.language not in translations:
             self.language = "en"
+        self._lang_prefix = f"{self.language}\x00"
+        self._help_rendered_language: Optional[str] = None
+        self._translation_refresh_pending = False
 
         self.donation_btc_address = "bc1q789yvmn0lhgee7hqm05hvsax8uc9372j4lsyz6"
 
@@ -1314,15 +998,35 @@ class ToolApp(ttk.Window):
         auto_update_default = bool(self.update_settings.get("auto_update_on_startup", True))
         self.auto_update_var = tk.BooleanVar(value=auto_update_default)
 
-        self._update_status_state = "idle"
-        self._update_status_context: Dict[str, str] = {}
+        # (state, context) snapshot; replaced as a whole so readers on any
+        # thread never see a state paired with another state's context.
+        self._update_status: Tuple[str, Dict[str, str]] = ("idle", {})
+        self._update_status_refresh_pending = False
         self.update_status_var = tk.StringVar()
         self._refresh_update_status_text()
 
-        self.translatable_widgets = []
+        # Translatable widgets are bucketed by attribute: nearly all use "text",
+        # which gets a direct configure(text=...) fast path during refreshes.
+        # Text entries are [widget, text_key, last_applied_translation] so a
+        # refresh can skip widgets whose translation did not change.
+        self._tr_text_widgets: List[List[Any]] = []
+        self._tr_other_widgets: List[Tuple[tk.Misc, str, str]] = []
         self.registered_tooltips: List[Tuple[Tooltip, str]] = []
         self.section_descriptions = []
         self.notebook_tabs = []
+        # Widgets consulted on every translation/resize refresh. They are built
+        # later (some only when their tab is first shown), so start them as None
+        # and let the refresh paths test for that instead of probing with hasattr.
+        self.header_title: Optional[ttk.Label] = None
+        self.header_subtitle: Optional[ttk.Label] = None
+        self.language_selector: Optional[ttk.Combobox] = None
+        self.help_text_area: Optional[ScrolledText] = None
+        self.rug_control_tree: Optional[ttk.Treeview] = None
+        self.rinven_image_folder_value: Optional[tk.StringVar] = None
+        self.resize_mode: Optional[tk.StringVar] = None
+        self.max_width_entry: Optional[ttk.Entry] = None
+        self.resize_percentage_entry: Optional[ttk.Entry] = None
+        self._applied_resize_mode: Optional[str] = None
         self.sidebar_nav = []
         self.advanced_cards = []
         self.view_in_room_preview_photo: Optional[ImageTk.PhotoImage] = None
@@ -1333,7 +1037,7 @@ class ToolApp(ttk.Window):
         self._rinven_preview_after: Optional[str] = None
         self.rinven_printer_var = tk.StringVar()
         self.rinven_label_size_var = tk.StringVar(
-            value=list(RINVEN_DYMO_LABEL_SIZES.keys())[0]
+            value=RINVEN_DYMO_LABEL_KEYS[0]
         )
         self._rinven_last_generation_context: Optional[Dict[str, Any]] = None
         self._rinven_print_preview_photo: Optional[ImageTk.PhotoImage] = None
@@ -1380,9 +1084,11 @@ class ToolApp(ttk.Window):
             value=self.tr(self.language_options.get(self.language, "English"))
         )
         self._updating_language_selector = False
+        self._language_values_for: Optional[str] = None
 
         self.ui_preferences = self.settings.setdefault("ui_preferences", {})
         self._base_named_font_sizes = {}
+        self._mono_fonts: Dict[str, tkfont.Font] = {}
         for name in (
             "TkDefaultFont",
             "TkTextFont",
@@ -1406,7 +1112,7 @@ class ToolApp(ttk.Window):
         self.inventory_macro_entry_delay = tk.DoubleVar(value=1.0)
         self.inventory_macro_running = False
 
-        self.update_idletasks()
+        # Screen metrics come straight from the display; no idle pump needed.
         screen_width = self.winfo_screenwidth()
         screen_height = self.winfo_screenheight()
         self.small_screen = screen_width < 1366 or screen_height < 900
@@ -1506,18 +1212,29 @@ class ToolApp(ttk.Window):
         self.section_notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         self.rug_control_results: List[Tuple[str, bool]] = []
+        # Only the first tab and the About panel (which hosts the update status
+        # and setup log) are built up front; the rest are populated on first view.
         self.create_file_image_panels(self.section_frames["File & Image Tools"])
-        self.create_color_palette_tab(self.section_frames["Color Palette"])
-        self.create_pdf_tools_tab(self.section_frames["PDF Tools"])
-        self.create_view_in_room_tab(self.section_frames["View in Room"])
-        self.create_data_calc_panels(self.section_frames["Utility"])
-        self.create_google_maps_scraper_tab(self.section_frames["Google Maps Scraper"])
-        self.create_rug_no_control_tab(self.section_frames["Column Match & Report"])
-        self.create_code_gen_panels(self.section_frames["Code Generators"])
-        self.create_rinven_import_panel(self.section_frames["Rinven Import Sheet Generator"])
-        self.create_rinven_tag_panel(self.section_frames["Rinven Tag"])
-        self.create_inventory_macro_tab(self.section_frames["Inventory Macro"])
         self.create_about_panel(self.section_frames["Help & About"])
+        tabs_by_title = {title: str(tab) for tab, title in self.notebook_tabs}
+        self._tab_builders: Dict[str, Callable[[], None]] = {
+            tabs_by_title[title]: functools.partial(builder, self.section_frames[title])
+            for title, builder in (
+                ("Color Palette", self.create_color_palette_tab),
+                ("PDF Tools", self.create_pdf_tools_tab),
+                ("View in Room", self.create_view_in_room_tab),
+                ("Utility", self.create_data_calc_panels),
+                ("Google Maps Scraper", self.create_google_maps_scraper_tab),
+                ("Column Match & Report", self.create_rug_no_control_tab),
+                ("Code Generators", self.create_code_gen_panels),
+                ("Rinven Import Sheet Generator", self.create_rinven_import_panel),
+                ("Rinven Tag", self.create_rinven_tag_panel),
+                ("Inventory Macro", self.create_inventory_macro_tab),
+            )
+        }
+        # The About panel is eager for its update status and setup log, but
+        # its read-only help text only needs to exist once the tab is shown.
+        self._tab_builders[tabs_by_title["Help & About"]] = self._build_help_text_area
 
         self.log_area = ScrolledText(self.content_frame, height=8)
         self.log_area.grid(row=1, column=0, sticky="nsew", pady=(12, 0))
@@ -1532,35 +1249,81 @@ class ToolApp(ttk.Window):
             self.log(self.tr("Automatic compact mode enabled for small screens."))
             self._auto_compact_message = False
 
-        self._background_threads: Set[threading.Thread] = set()
-        self._thread_lock = threading.RLock()
         self._shutdown_event = threading.Event()
         self._update_dialog: Optional[tk.Toplevel] = None
+        self._completion_dialog: Optional[tk.Toplevel] = None
+        self._completion_queue: "deque[Tuple[str, str, str]]" = deque()
+        self._completion_showing = False
         self._update_in_progress = False
+        self._update_check_inflight = threading.Event()
         self._dependency_setup_in_progress = False
         self._dependency_setup_cancel = threading.Event()
 
         self.protocol("WM_DELETE_WINDOW", self.on_close)
-        
+        self.deiconify()
+
         # Safe Update Sync - Background check on startup
-        self.after(2000, self.begin_safe_update_check)
+        self.after(2000, self.begin_safe_update_check, True)
 
         # Donation Popup - Show 5 seconds after startup
         self.after(5000, self.show_donation_popup)
 
-    def begin_safe_update_check(self) -> None:
-        """Start the background check for updates."""
+    def begin_safe_update_check(self, use_cache: bool = False) -> None:
+        """Start the background check for updates.
+
+        With ``use_cache`` (the startup check) a result stored less than
+        ``UPDATE_CHECK_CACHE_S`` ago is reused instead of querying GitHub.
+        """
         if not self.auto_update_var.get():
             return
-            
+        # Single-flight: repeated clicks while a check is running are coalesced.
+        if self._update_check_inflight.is_set():
+            return
+        self._update_check_inflight.set()
+
         self._set_update_status("checking")
-        self.run_in_thread(self._perform_safe_update_check)
+        cached = self.update_settings.get("last_check") if use_cache else None
+        if (
+            isinstance(cached, dict)
+            and cached.get("app_version") == __version__
+            and 0 <= time.time() - cached.get("time", 0) < UPDATE_CHECK_CACHE_S
+        ):
+            self.run_in_thread(self._perform_safe_update_check, cached.get("result") or None)
+        else:
+            # Copied here on the UI thread; the worker must not read the
+            # settings dict while it may be edited or saved.
+            release_cache = dict(self.update_settings.get("release_cache") or {})
+            self.run_in_thread(self._perform_safe_update_check, None, release_cache)
+
+    def _perform_safe_update_check(
+        self, cached_info: Optional[dict] = None, release_cache: Optional[dict] = None
+    ) -> None:
+        """Query GitHub for updates (safe check only).
+
+        ``release_cache`` is a private copy of the stored ETag cache; when it
+        is None, ``cached_info`` is reused instead of querying GitHub.
+        """
+        try:
+            self._run_safe_update_check(cached_info, release_cache)
+        finally:
+            self._update_check_inflight.clear()
 
-    def _perform_safe_update_check(self) -> None:
-        """Query GitHub for updates (safe check only)."""
+    def _run_safe_update_check(self, cached_info: Optional[dict], release_cache: Optional[dict]) -> None:
+        query = release_cache is not None
         try:
-            update_info = updater.check_for_updates()
+            update_info = updater.check_for_updates(cache=release_cache, raise_errors=True) if query else cached_info
+
             def update_ui() -> None:
+                # Only reached when the query succeeded; failures raise above
+                # and are never cached as "up to date".
+                if query:
+                    self.update_settings["release_cache"] = release_cache
+                    self.update_settings["last_check"] = {
+                        "time": time.time(),
+                        "app_version": __version__,
+                        "result": update_info,
+                    }
+                    self._schedule_settings_save()
                 if update_info:
                     version = update_info.get("version")
                     self._set_update_status("update_available", version=version)
@@ -1579,9 +1342,11 @@ class ToolApp(ttk.Window):
             
             self.after(0, update_ui)
         except Exception as e:
-            def report_error() -> None:
-                self._set_update_status("error", error=str(e))
-            self.after(0, report_error)
+            import requests
+
+            # Bind the status now: Python unbinds ``e`` when this block ends.
+            state = "timeout" if isinstance(e, requests.Timeout) else "error"
+            self.after(0, functools.partial(self._set_update_status, state, error=str(e)))
 
     def _bg_download_and_stage_update(self, download_url: str, version: str) -> None:
         try:
@@ -1600,8 +1365,15 @@ class ToolApp(ttk.Window):
             base_exe_name = os.path.basename(exe_path)
             
             # Create a simple batch file to quickly extract the zip and restart
+            # Wait for this process to exit so the exe is no longer locked.
+            pid = os.getpid()
             bat_script = f"""@echo off
-timeout /t 2 /nobreak >nul
+:wait_for_exit
+tasklist /FI "PID eq {pid}" 2>nul | find "{pid}" >nul
+if not errorlevel 1 (
+    timeout /t 1 /nobreak >nul
+    goto wait_for_exit
+)
 del "{base_exe_name}"
 ren "{os.path.basename(new_exe_path)}" "{base_exe_name}"
 start "" "{base_exe_name}"
@@ -1610,11 +1382,11 @@ del "%~f0"
             with open(update_bat_path, "w", encoding="utf-8") as f:
                 f.write(bat_script)
                 
-            self.after(0, lambda: self.log(f"Update v{version} downloaded. It will be installed automatically on next exit."))
+            self.after(0, self.log, f"Update v{version} downloaded. It will be installed automatically on next exit.")
             self._staged_update_bat = update_bat_path
 
         except Exception as e:
-            self.after(0, lambda: self.log(f"Background update download failed: {e}"))
+            self.after(0, self.log, f"Background update download failed: {e}")
 
     def open_latest_release(self) -> None:
         """Open the latest release page in the default web browser."""
@@ -1644,10 +1416,21 @@ del "%~f0"
         return size if base >= 0 else -size
 
     def _font(self, family: str, base: int, weight: Optional[str] = None) -> tuple:
-        size = self._scaled_size(base)
-        if weight:
-            return (family, size, weight)
-        return (family, size)
+        return _font_spec(family, self._scaled_size(base), weight)
+
+    def _mono_font(self, base: int) -> str:
+        """Return the name of a shared monospace font at ``base`` size.
+
+        Tk resolves the family once when the named font is created; widgets
+        then reference it by name, and _update_named_fonts rescales it in place.
+        """
+        name = f"AllOneMono{base}"
+        if name not in self._mono_fonts:
+            self._mono_fonts[name] = tkfont.Font(
+                self, name=name, family=FONT_MONO, size=self._scaled_size(base)
+            )
+            self._base_named_font_sizes[name] = base
+        return name
 
     def _update_named_fonts(self) -> None:
         try:
@@ -1676,7 +1459,7 @@ del "%~f0"
             background="#0b1120",
             foreground="#f1f5f9",
             insertbackground="#f1f5f9",
-            font=("Cascadia Code", self._scaled_size(10)),
+            font=self._mono_font(10),
             relief="flat",
             borderwidth=0,
         )
@@ -1684,28 +1467,40 @@ del "%~f0"
     def _apply_setup_log_theme(self) -> None:
         if not hasattr(self, "setup_log_area"):
             return
-        self.setup_log_area.configure(
-            background=self.theme_colors["card_bg"],
-            foreground=self.theme_colors["text_primary"],
-            insertbackground=self.theme_colors["text_primary"],
-            font=("Cascadia Code", self._scaled_size(9)),
+        self._apply_text_area_theme(self.setup_log_area, font=self._mono_font(9))
+
+    def _apply_text_area_theme(self, widget: tk.Text, **options: Any) -> None:
+        """Apply the card colours to a read-only text area."""
+        card_bg = self.theme_colors["card_bg"]
+        text_primary = self.theme_colors["text_primary"]
+        options.update(
+            background=card_bg,
+            foreground=text_primary,
+            insertbackground=text_primary,
             highlightthickness=0,
             borderwidth=0,
         )
+        supported = ToolApp._text_disabled_colors_supported
+        if supported is not False:
+            options.update(disabledforeground=text_primary, disabledbackground=card_bg)
         try:
-            self.setup_log_area.configure(
-                disabledforeground=self.theme_colors["text_primary"],
-                disabledbackground=self.theme_colors["card_bg"],
-            )
+            widget.configure(**options)
         except tk.TclError:
-            pass
+            if supported is not None:
+                raise
+            # Some Tk builds do not support disabled foreground/background
+            # options; remember that so later calls need a single configure.
+            del options["disabledforeground"], options["disabledbackground"]
+            widget.configure(**options)
+            supported = False
+        ToolApp._text_disabled_colors_supported = supported is not False
 
     def _create_sidebar_button(self, title: str, tab: ttk.Frame) -> None:
         button = ttk.Button(
             self.sidebar_button_area,
             text=self.tr(title),
             style="Sidebar.TButton",
-            command=lambda t=tab: self.section_notebook.select(t),
+            command=functools.partial(self.section_notebook.select, tab),
         )
         button.pack(fill="x", pady=(0, 4))
         self.register_widget(button, title)
@@ -1725,6 +1520,10 @@ del "%~f0"
         if not hasattr(self, "section_notebook"):
             return
         current = self.section_notebook.select()
+        builder = getattr(self, "_tab_builders", {}).pop(current, None)
+        if builder is not None:
+            builder()
+            self._apply_advanced_visibility()
         if hasattr(self, "google_maps_scraper_tab") and hasattr(self, "notebook_tabs"):
             for tab, title in self.notebook_tabs:
                 if title != "Google Maps Scraper":
@@ -1759,6 +1558,20 @@ del "%~f0"
 
     def _on_toggle_auto_update(self) -> None:
         self.update_settings["auto_update_on_startup"] = bool(self.auto_update_var.get())
+        self._schedule_settings_save()
+
+    def _schedule_settings_save(self) -> None:
+        """Coalesce bursts of preference changes into a single settings write."""
+        if self._settings_save_after is None:
+            self._settings_save_after = self.after(SETTINGS_SAVE_DELAY_MS, self._flush_settings_save)
+
+    def _flush_settings_save(self) -> None:
+        if self._settings_save_after is not None:
+            try:
+                self.after_cancel(self._settings_save_after)
+            except tk.TclError:
+                pass
+            self._settings_save_after = None
         save_settings(self.settings)
 
     def _on_toggle_compact(self) -> None:
@@ -1803,32 +1616,52 @@ del "%~f0"
         self.ui_preferences["zoom_level"] = self.zoom_level
         self.ui_preferences["sidebar_collapsed"] = bool(self.sidebar_collapsed)
         self.ui_preferences["show_advanced"] = bool(self.show_advanced)
-        save_settings(self.settings)
+        self._schedule_settings_save()
 
     def _persist_view_preferences(self) -> None:
         self.ui_preferences["window_geometry"] = self.geometry()
         self._save_ui_preferences()
 
     def log(self, message: str) -> None:
-        """Append a message to the on-screen log in a thread-safe way."""
+        """Queue a message for the on-screen log in a thread-safe way.
+
+        Messages are written to the widget in batches by ``_flush_log`` so a
+        chatty background task costs one insert per flush, not per line.
+        """
 
         if message is None:
             return
 
-        def append() -> None:
-            text = str(message)
-            if hasattr(self, "log_area"):
-                self.log_area.config(state=tk.NORMAL)
-                self.log_area.insert(tk.END, text + "\n")
-                self.log_area.see(tk.END)
-                self.log_area.config(state=tk.DISABLED)
-            else:
-                print(text)
+        self._log_buffer.append(str(message))
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
 
-        if threading.current_thread() is threading.main_thread():
-            append()
-        else:
-            self.after(0, append)
+    def _flush_log(self) -> None:
+        self._log_flush_pending = False
+        buffer = self._log_buffer
+        batch: List[str] = []
+        # popleft is atomic, so worker threads may keep appending meanwhile.
+        try:
+            while True:
+                batch.append(buffer.popleft())
+        except IndexError:
+            pass
+        if not batch:
+            return
+
+        text = "\n".join(batch)
+        if not hasattr(self, "log_area"):
+            print(text)
+            return
+
+        self.log_area.config(state=tk.NORMAL)
+        self.log_area.insert(tk.END, text + "\n")
+        line_count = int(self.log_area.index("end-1c").split(".")[0])
+        if line_count > LOG_AREA_MAX_LINES:
+            self.log_area.delete("1.0", f"{line_count - LOG_AREA_MAX_LINES + 1}.0")
+        self.log_area.see(tk.END)
+        self.log_area.config(state=tk.DISABLED)
 
     def _on_update_status_changed(self, state: str, context: Optional[Dict[str, str]] = None) -> None:
         context = context or {}
@@ -1842,63 +1675,79 @@ del "%~f0"
             self.after(0, apply)
 
     def _set_update_status(self, state: str, **context) -> None:
-        self._update_status_state = state or "idle"
-        self._update_status_context = {
-            key: str(value)
-            for key, value in (context or {}).items()
-            if value is not None
-        }
+        self._update_status = (
+            state or "idle",
+            {key: str(value) for key, value in (context or {}).items() if value is not None},
+        )
+        # Coalesce bursts of transitions (checking -> available -> preparing)
+        # into a single widget update once the event loop is idle.
+        if not self._update_status_refresh_pending:
+            self._update_status_refresh_pending = True
+            self.after_idle(self._flush_update_status)
+
+    def _flush_update_status(self) -> None:
+        self._update_status_refresh_pending = False
         self._refresh_update_status_text()
 
     def _refresh_update_status_text(self) -> None:
-        if not hasattr(self, "update_status_var"):
-            return
-
-        state = getattr(self, "_update_status_state", "idle") or "idle"
-        context = getattr(self, "_update_status_context", {}) or {}
-        version = context.get("version") or __version__
-        if state == "checking":
-            text = self.tr("UpdateStatus.Checking")
-        elif state == "timeout":
-            text = self.tr("UpdateStatus.Timeout")
-        elif state == "error":
-            error_message = context.get("error") or ""
-            text = self.tr("UpdateStatus.Error").format(error=error_message)
-        elif state == "up_to_date":
-            text = self.tr("UpdateStatus.UpToDate").format(version=version)
-        elif state == "update_available":
-            text = self.tr("UpdateStatus.UpdateAvailable").format(version=version)
-        elif state == "auto_installing":
-            text = self.tr("UpdateStatus.AutoInstalling").format(version=version)
-        elif state == "preparing":
-            text = self.tr("UpdateStatus.Preparing").format(version=version)
-        else:
-            text = self.tr("UpdateStatus.Idle")
+        state, context = self._update_status
+        template = self.tr(UPDATE_STATUS_KEYS.get(state, "UpdateStatus.Idle"))
+        text = template.format(
+            version=context.get("version") or __version__,
+            error=context.get("error") or "",
+        )
+        # Language refreshes often render the same text; skip the write so the
+        # variable's trace (the "Update now" button toggle) does not fire.
+        self._set_var_if_changed(self.update_status_var, text)
+
+    def run_in_thread(self, target: Callable, *args, **kwargs) -> Future:
+        """Queue a callable for the background workers and report unexpected errors."""
+        future: Future = Future()
+        future.add_done_callback(self._on_background_done)
+        self._task_queue.put((future, target, args, kwargs))
+        return future
+
+    def _run_background_tasks(self) -> None:
+        while True:
+            task = self._task_queue.get()
+            if task is None:
+                break
+            future, target, args, kwargs = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = target(*args, **kwargs)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
 
-        self.update_status_var.set(text)
+    def _stop_background_tasks(self) -> None:
+        """Cancel queued tasks and let each worker exit once it is idle."""
+        while True:
+            try:
+                task = self._task_queue.get_nowait()
+            except queue.Empty:
+                break
+            if task is not None:
+                task[0].cancel()
+        for _ in range(BACKGROUND_WORKERS):
+            self._task_queue.put(None)
 
-    def run_in_thread(self, target: Callable, *args, daemon: bool = True, **kwargs) -> threading.Thread:
-        """Execute a callable in a background thread and report unexpected errors."""
+    def _on_background_done(self, future: Future) -> None:
+        # Runs on the worker thread (or inline if the future already finished).
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is None or not isinstance(exc, Exception):
+            return
 
-        def worker() -> None:
-            try:
-                target(*args, **kwargs)
-            except Exception as exc:  # pragma: no cover - defensive
-                def report() -> None:
-                    error_text = f"{self.tr('Error')}: {exc}"
-                    self.log(error_text)
-                    messagebox.showerror(self.tr("Error"), str(exc))
-
-                self.after(0, report)
-            finally:
-                with self._thread_lock:
-                    self._background_threads.discard(threading.current_thread())
+        def report() -> None:
+            error_text = f"{self.tr('Error')}: {exc}"
+            self.log(error_text)
+            messagebox.showerror(self.tr("Error"), str(exc))
 
-        thread = threading.Thread(target=worker, daemon=daemon)
-        with self._thread_lock:
-            self._background_threads.add(thread)
-        thread.start()
-        return thread
+        self.after(0, report)
 
     def is_auto_update_enabled(self) -> bool:
         return bool(self.auto_update_var.get())
@@ -1939,7 +1788,8 @@ del "%~f0"
                 except Exception:
                     pass
 
-    def show_toast(self, message: str, duration: int = 4000) -> None:
+    def show_toast(self, message: str, duration: int = 4000, level: str = "info") -> None:
+        """Show a self-dismissing notice; used instead of modal dialogs for quick feedback."""
         if not message:
             return
 
@@ -1953,11 +1803,11 @@ del "%~f0"
             toast,
             text=message,
             bg=self.theme_colors.get("card_bg", "#111c2e"),
-            fg=self.theme_colors.get("text_primary", "#f1f5f9"),
+            fg=self.theme_colors.get("error_fg" if level == "error" else "text_primary", "#f1f5f9"),
             padx=12,
             pady=8,
             wraplength=280,
-            font=("Helvetica", self._scaled_size(10)),
+            font=self._font(FONT_TEXT, 10),
         )
         label.pack()
 
@@ -1975,20 +1825,69 @@ del "%~f0"
 
         def show_dialog() -> None:
             normalized = (status or "").strip().lower()
-            title = self.tr(status) if status else ""
             if normalized == "error":
-                messagebox.showerror(self.tr("Error"), message)
+                self._show_completion_dialog(self.tr("Error"), message, "danger")
             elif normalized == "warning":
-                messagebox.showwarning(self.tr("Warning"), message)
+                self._show_completion_dialog(self.tr("Warning"), message, "warning")
             else:
-                dialog_title = title or self.tr("Information")
-                messagebox.showinfo(dialog_title, message)
+                dialog_title = self.tr(status) if status else self.tr("Information")
+                self._show_completion_dialog(dialog_title, message, "info")
 
         if threading.current_thread() is threading.main_thread():
             show_dialog()
         else:
             self.after(0, show_dialog)
 
+    def _show_completion_dialog(self, title: str, message: str, bootstyle: str) -> None:
+        """Queue a completion message and show it in the reused completion dialog.
+
+        Several background tasks can finish together; their messages are shown
+        one after another, each on OK, instead of replacing the visible one.
+        """
+        self._completion_queue.append((title, message, bootstyle))
+        if not self._completion_showing:
+            self._show_next_completion()
+
+    def _show_next_completion(self, _event=None) -> None:
+        dialog = self._completion_dialog
+        self._completion_showing = bool(self._completion_queue)
+        if not self._completion_queue:
+            if dialog is not None and dialog.winfo_exists():
+                dialog.grab_release()
+                dialog.withdraw()
+            return
+
+        if dialog is None or not dialog.winfo_exists():
+            dialog = tk.Toplevel(self)
+            dialog.withdraw()
+            dialog.transient(self)
+            dialog.resizable(False, False)
+            frame = ttk.Frame(dialog, padding=16)
+            frame.pack(fill="both", expand=True)
+            self._completion_label = ttk.Label(frame, wraplength=360, justify="left")
+            self._completion_label.pack(fill="x", pady=(0, 12))
+            self._completion_ok = ttk.Button(frame, width=10, command=self._show_next_completion)
+            self._completion_ok.pack(side="right")
+            dialog.bind("<Return>", self._show_next_completion)
+            dialog.bind("<Escape>", self._show_next_completion)
+            dialog.protocol("WM_DELETE_WINDOW", self._show_next_completion)
+            self._completion_dialog = dialog
+
+        title, message, bootstyle = self._completion_queue.popleft()
+        dialog.title(title)
+        self._completion_label.configure(text=message, bootstyle=bootstyle)
+        self._completion_ok.configure(text=self.tr("OK"), bootstyle=bootstyle)
+
+        # Center over the main window, as messagebox does.
+        dialog.update_idletasks()
+        x = self.winfo_rootx() + (self.winfo_width() - dialog.winfo_reqwidth()) // 2
+        y = self.winfo_rooty() + (self.winfo_height() - dialog.winfo_reqheight()) // 2
+        dialog.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+        self._completion_ok.focus_set()
+
     def setup_styles(self):
         """Configure a modern dark theme for the application widgets."""
         base_bg = "#0b1120"
@@ -2003,6 +1902,7 @@ del "%~f0"
         text_muted = "#94a3b8"
         tooltip_bg = "#111c2e"
         tooltip_fg = text_primary
+        error_fg = "#fca5a5"
         sidebar_bg = "#081021"
 
         self.theme_colors = {
@@ -2018,173 +1918,16 @@ del "%~f0"
             "text_muted": text_muted,
             "tooltip_bg": tooltip_bg,
             "tooltip_fg": tooltip_fg,
+            "error_fg": error_fg,
         }
 
         self.configure(bg=base_bg)
 
         style = self.style
 
-        style.configure("TFrame", background=base_bg)
-        style.configure("Header.TFrame", background=base_bg)
-        style.configure(
-            "Card.TLabelframe",
-            background=card_bg,
-            borderwidth=0,
-            padding=self._pad_value(15, 6),
-        )
-        style.configure("PanelBody.TFrame", background=card_bg)
-        style.configure(
-            "Card.TLabelframe.Label",
-            background=card_bg,
-            foreground=text_primary,
-            font=self._font("Segoe UI Semibold", 11),
-        )
-        style.configure(
-            "TLabel",
-            background=card_bg,
-            foreground=text_primary,
-            font=self._font("Segoe UI", 10),
-        )
-        style.configure(
-            "Description.TLabel",
-            background=card_bg,
-            foreground=text_muted,
-            font=self._font("Segoe UI", 10),
-        )
-        style.configure(
-            "Primary.TLabel",
-            background=base_bg,
-            foreground=text_primary,
-            font=self._font("Segoe UI Semibold", 18),
-        )
-        style.configure(
-            "Secondary.TLabel",
-            background=base_bg,
-            foreground=text_muted,
-            font=self._font("Segoe UI", 11),
-        )
-        style.configure("Toolbar.TFrame", background=base_bg)
-        style.configure(
-            "TNotebook",
-            background=base_bg,
-            borderwidth=0,
-            tabmargins=(4, 2, 4, 0),
-        )
-        # Hide the default tab bar because navigation is handled exclusively by the sidebar
-        style.layout("TNotebook.Tab", [])
-        style.configure(
-            "TNotebook.Tab",
-            background=card_bg,
-            foreground=text_primary,
-            padding=(self._pad_value(16, 6), self._pad_value(8, 3)),
-            font=self._font("Segoe UI", 10),
-        )
-        style.map(
-            "TNotebook.Tab",
-            background=[("selected", accent), ("active", accent_hover)],
-            foreground=[("selected", text_primary), ("active", text_primary)],
-        )
-        style.configure(
-            "TButton",
-            background=accent,
-            foreground=text_primary,
-            font=self._font("Segoe UI Semibold", 10),
-            padding=(self._pad_value(14, 6), self._pad_value(6, 3)),
-            borderwidth=0,
-        )
-        style.map(
-            "TButton",
-            background=[("active", accent_hover), ("disabled", "#1e293b")],
-            foreground=[("disabled", text_muted), ("active", text_primary)],
-        )
-        style.configure(
-            "TEntry",
-            fieldbackground="#111827",
-            foreground=text_primary,
-            insertcolor=text_primary,
-            padding=self._pad_value(8, 4),
-        )
-        style.configure(
-            "TCombobox",
-            fieldbackground="#111827",
-            foreground=text_primary,
-            background=card_bg,
-        )
-        style.map(
-            "TCombobox",
-            fieldbackground=[("readonly", "#111827"), ("disabled", "#1f2937")],
-            foreground=[("readonly", text_primary), ("disabled", text_muted)],
-        )
-        style.configure(
-            "Light.TCombobox",
-            fieldbackground=card_bg,
-            foreground=text_primary,
-            background=card_bg,
-        )
-        style.map(
-            "Light.TCombobox",
-            fieldbackground=[("readonly", card_bg), ("disabled", "#1f2937")],
-            foreground=[("readonly", text_primary), ("disabled", text_muted)],
-        )
-        style.configure(
-            "TLabelframe",
-            background=card_bg,
-            foreground=text_primary,
-        )
-        style.configure(
-            "TRadiobutton",
-            background=card_bg,
-            foreground=text_primary,
-            font=self._font("Segoe UI", 10),
-        )
-        style.configure(
-            "TCheckbutton",
-            background=base_bg,
-            foreground=text_primary,
-            font=self._font("Segoe UI", 10),
-        )
-        style.map(
-            "TEntry",
-            fieldbackground=[("disabled", "#1f2937")],
-            foreground=[("disabled", text_muted)],
-        )
-        style.map(
-            "TCheckbutton",
-            background=[("active", card_bg)],
-            foreground=[("disabled", text_muted)],
-        )
-        style.configure(
-            "Sidebar.TFrame",
-            background=sidebar_bg,
-        )
-        style.configure(
-            "SidebarHeader.TFrame",
-            background=sidebar_bg,
-        )
+        ui_font = self._font(FONT_UI, 10)
+        ui_semibold_font = self._font(FONT_UI_SEMIBOLD, 10)
         sidebar_padding = (self._pad_value(12, 6), self._pad_value(6, 3))
-        style.configure(
-            "Sidebar.TButton",
-            background=card_bg,
-            foreground=text_primary,
-            font=self._font("Segoe UI", 10),
-            padding=sidebar_padding,
-        )
-        style.map(
-            "Sidebar.TButton",
-            background=[("active", panel_header_hover)],
-        )
-        style.configure(
-            "SidebarSelected.TButton",
-            background=accent,
-            foreground=text_primary,
-            font=self._font("Segoe UI Semibold", 10),
-            padding=sidebar_padding,
-        )
-        style.map(
-            "SidebarSelected.TButton",
-            background=[("active", accent_hover)],
-            foreground=[("active", text_primary)],
-        )
 
         tree_base_bg = "#111822"
         tree_alt_bg = "#1a2332"
@@ -2193,88 +1936,6 @@ del "%~f0"
         tree_header_bg = "#2a3344"
         tree_header_fg = "#ffffff"
 
-        style.configure(
-            "Rinven.Treeview",
-            background=tree_base_bg,
-            fieldbackground=tree_base_bg,
-            foreground=tree_fg,
-            bordercolor=tree_border,
-            lightcolor=tree_border,
-            darkcolor=tree_border,
-            rowheight=self._scaled_size(26),
-        )
-        style.map(
-            "Rinven.Treeview",
-            background=[("selected", accent)],
-            foreground=[("selected", tree_header_fg)],
-            bordercolor=[("selected", accent)],
-        )
-        style.layout(
-            "Rinven.Treeview",
-            [
-                (
-                    "Treeview.border",
-                    {
-                        "sticky": "nswe",
-                        "border": 1,
-                        "children": [
-                            (
-                                "Treeview.padding",
-                                {
-                                    "sticky": "nswe",
-                                    "children": [("Treeview.treearea", {"sticky": "nswe"})],
-                                },
-                            )
-                        ],
-                    },
-                )
-            ],
-        )
-        style.configure(
-            "Rinven.Treeview.Heading",
-            background=tree_header_bg,
-            foreground=tree_header_fg,
-            bordercolor=tree_border,
-            font=self._font("Segoe UI", 10, "bold"),
-            padding=(self._pad_value(14, 8), self._pad_value(10, 6)),
-        )
-        style.map(
-            "Rinven.Treeview.Heading",
-            background=[("active", panel_header_hover), ("pressed", accent_hover)],
-            foreground=[("active", tree_header_fg)],
-        )
-        style.layout(
-            "Rinven.Treeview.Heading",
-            [
-                (
-                    "Treeheading.cell",
-                    {
-                        "sticky": "nswe",
-                        "children": [
-                            (
-                                "Treeheading.border",
-                                {
-                                    "sticky": "nswe",
-                                    "children": [
-                                        (
-                                            "Treeheading.padding",
-                                            {
-                                                "sticky": "nswe",
-                                                "children": [
-                                                    ("Treeheading.image", {"side": "left", "sticky": ""}),
-                                                    ("Treeheading.text", {"sticky": "nswe"}),
-                                                ],
-                                            },
-                                        )
-                                    ],
-                                },
-                            )
-                        ],
-                    },
-                )
-            ],
-        )
-
         scrollbar_colors = {
             "background": tree_alt_bg,
             "troughcolor": tree_base_bg,
@@ -2283,37 +1944,252 @@ del "%~f0"
             "darkcolor": tree_border,
             "arrowcolor": tree_fg,
         }
-        style.configure("Dark.Vertical.TScrollbar", **scrollbar_colors)
-        style.configure("Dark.Horizontal.TScrollbar", **scrollbar_colors)
-        style.map(
-            "Dark.Vertical.TScrollbar",
-            background=[("active", panel_header_hover), ("pressed", accent_hover)],
-            arrowcolor=[("disabled", text_muted), ("active", tree_header_fg)],
-        )
-        style.map(
-            "Dark.Horizontal.TScrollbar",
-            background=[("active", panel_header_hover), ("pressed", accent_hover)],
-            arrowcolor=[("disabled", text_muted), ("active", tree_header_fg)],
-        )
-
-        style.configure("Horizontal.TSeparator", background="#1f2937")
-
-        option_font = self._font("Segoe UI", 10)
-        self.option_add("*TCombobox*Listbox.font", option_font)
-        self.option_add("*TCombobox*Listbox.foreground", text_primary)
-        self.option_add("*TCombobox*Listbox.background", card_bg)
-        self.option_add("*Background", base_bg)
-        self.option_add("*Entry.background", "#111827")
-        self.option_add("*Entry.foreground", text_primary)
-        self.option_add("*Listbox.background", card_bg)
-        self.option_add("*Listbox.foreground", text_primary)
-        self.option_add("*Font", option_font)
-        self.option_add("*Foreground", text_primary)
+
+        # Sizes and fonts follow the zoom level, so these are re-applied on
+        # every call; the state maps and layouts below only depend on colours.
+        for name, options in (
+            ("TFrame", {"background": base_bg}),
+            ("Header.TFrame", {"background": base_bg}),
+            ("Card.TLabelframe", {"background": card_bg, "borderwidth": 0, "padding": self._pad_value(15, 6)}),
+            ("PanelBody.TFrame", {"background": card_bg}),
+            (
+                "Card.TLabelframe.Label",
+                {"background": card_bg, "foreground": text_primary, "font": self._font(FONT_UI_SEMIBOLD, 11)},
+            ),
+            ("TLabel", {"background": card_bg, "foreground": text_primary, "font": ui_font}),
+            ("Description.TLabel", {"background": card_bg, "foreground": text_muted, "font": ui_font}),
+            (
+                "Primary.TLabel",
+                {"background": base_bg, "foreground": text_primary, "font": self._font(FONT_UI_SEMIBOLD, 18)},
+            ),
+            (
+                "Secondary.TLabel",
+                {"background": base_bg, "foreground": text_muted, "font": self._font(FONT_UI, 11)},
+            ),
+            ("Toolbar.TFrame", {"background": base_bg}),
+            ("TNotebook", {"background": base_bg, "borderwidth": 0, "tabmargins": (4, 2, 4, 0)}),
+            (
+                "TNotebook.Tab",
+                {
+                    "background": card_bg,
+                    "foreground": text_primary,
+                    "padding": (self._pad_value(16, 6), self._pad_value(8, 3)),
+                    "font": ui_font,
+                },
+            ),
+            (
+                "TButton",
+                {
+                    "background": accent,
+                    "foreground": text_primary,
+                    "font": ui_semibold_font,
+                    "padding": (self._pad_value(14, 6), self._pad_value(6, 3)),
+                    "borderwidth": 0,
+                },
+            ),
+            (
+                "TEntry",
+                {
+                    "fieldbackground": "#111827",
+                    "foreground": text_primary,
+                    "insertcolor": text_primary,
+                    "padding": self._pad_value(8, 4),
+                },
+            ),
+            ("TCombobox", {"fieldbackground": "#111827", "foreground": text_primary, "background": card_bg}),
+            ("Light.TCombobox", {"fieldbackground": card_bg, "foreground": text_primary, "background": card_bg}),
+            ("TLabelframe", {"background": card_bg, "foreground": text_primary}),
+            ("TRadiobutton", {"background": card_bg, "foreground": text_primary, "font": ui_font}),
+            ("TCheckbutton", {"background": base_bg, "foreground": text_primary, "font": ui_font}),
+            ("Sidebar.TFrame", {"background": sidebar_bg}),
+            ("SidebarHeader.TFrame", {"background": sidebar_bg}),
+            (
+                "Sidebar.TButton",
+                {"background": card_bg, "foreground": text_primary, "font": ui_font, "padding": sidebar_padding},
+            ),
+            (
+                "SidebarSelected.TButton",
+                {"background": accent, "foreground": text_primary, "font": ui_semibold_font, "padding": sidebar_padding},
+            ),
+            (
+                "Rinven.Treeview",
+                {
+                    "background": tree_base_bg,
+                    "fieldbackground": tree_base_bg,
+                    "foreground": tree_fg,
+                    "bordercolor": tree_border,
+                    "lightcolor": tree_border,
+                    "darkcolor": tree_border,
+                    "rowheight": self._scaled_size(26),
+                },
+            ),
+            (
+                "Rinven.Treeview.Heading",
+                {
+                    "background": tree_header_bg,
+                    "foreground": tree_header_fg,
+                    "bordercolor": tree_border,
+                    "font": self._font(FONT_UI, 10, "bold"),
+                    "padding": (self._pad_value(14, 8), self._pad_value(10, 6)),
+                },
+            ),
+            ("Dark.Vertical.TScrollbar", scrollbar_colors),
+            ("Dark.Horizontal.TScrollbar", scrollbar_colors),
+            ("Horizontal.TSeparator", {"background": "#1f2937"}),
+        ):
+            style.configure(name, **options)
+
+        if not self._static_styles_installed:
+            self._static_styles_installed = True
+            # Hide the default tab bar because navigation is handled exclusively by the sidebar
+            style.layout("TNotebook.Tab", [])
+            scrollbar_map = {
+                "background": [("active", panel_header_hover), ("pressed", accent_hover)],
+                "arrowcolor": [("disabled", text_muted), ("active", tree_header_fg)],
+            }
+            for name, state_map in (
+                (
+                    "TNotebook.Tab",
+                    {
+                        "background": [("selected", accent), ("active", accent_hover)],
+                        "foreground": [("selected", text_primary), ("active", text_primary)],
+                    },
+                ),
+                (
+                    "TButton",
+                    {
+                        "background": [("active", accent_hover), ("disabled", "#1e293b")],
+                        "foreground": [("disabled", text_muted), ("active", text_primary)],
+                    },
+                ),
+                (
+                    "TCombobox",
+                    {
+                        "fieldbackground": [("readonly", "#111827"), ("disabled", "#1f2937")],
+                        "foreground": [("readonly", text_primary), ("disabled", text_muted)],
+                    },
+                ),
+                (
+                    "Light.TCombobox",
+                    {
+                        "fieldbackground": [("readonly", card_bg), ("disabled", "#1f2937")],
+                        "foreground": [("readonly", text_primary), ("disabled", text_muted)],
+                    },
+                ),
+                (
+                    "TEntry",
+                    {
+                        "fieldbackground": [("disabled", "#1f2937")],
+                        "foreground": [("disabled", text_muted)],
+                    },
+                ),
+                (
+                    "TCheckbutton",
+                    {
+                        "background": [("active", card_bg)],
+                        "foreground": [("disabled", text_muted)],
+                    },
+                ),
+                ("Sidebar.TButton", {"background": [("active", panel_header_hover)]}),
+                (
+                    "SidebarSelected.TButton",
+                    {
+                        "background": [("active", accent_hover)],
+                        "foreground": [("active", text_primary)],
+                    },
+                ),
+                (
+                    "Rinven.Treeview",
+                    {
+                        "background": [("selected", accent)],
+                        "foreground": [("selected", tree_header_fg)],
+                        "bordercolor": [("selected", accent)],
+                    },
+                ),
+                (
+                    "Rinven.Treeview.Heading",
+                    {
+                        "background": [("active", panel_header_hover), ("pressed", accent_hover)],
+                        "foreground": [("active", tree_header_fg)],
+                    },
+                ),
+                ("Dark.Vertical.TScrollbar", scrollbar_map),
+                ("Dark.Horizontal.TScrollbar", scrollbar_map),
+            ):
+                style.map(name, **state_map)
+            for pattern, value in (
+                ("*TCombobox*Listbox.foreground", text_primary),
+                ("*TCombobox*Listbox.background", card_bg),
+                ("*Background", base_bg),
+                ("*Entry.background", "#111827"),
+                ("*Entry.foreground", text_primary),
+                ("*Listbox.background", card_bg),
+                ("*Listbox.foreground", text_primary),
+                ("*Foreground", text_primary),
+            ):
+                self.option_add(pattern, value)
+            style.layout(
+                "Rinven.Treeview",
+                [
+                    (
+                        "Treeview.border",
+                        {
+                            "sticky": "nswe",
+                            "border": 1,
+                            "children": [
+                                (
+                                    "Treeview.padding",
+                                    {
+                                        "sticky": "nswe",
+                                        "children": [("Treeview.treearea", {"sticky": "nswe"})],
+                                    },
+                                )
+                            ],
+                        },
+                    )
+                ],
+            )
+            style.layout(
+                "Rinven.Treeview.Heading",
+                [
+                    (
+                        "Treeheading.cell",
+                        {
+                            "sticky": "nswe",
+                            "children": [
+                                (
+                                    "Treeheading.border",
+                                    {
+                                        "sticky": "nswe",
+                                        "children": [
+                                            (
+                                                "Treeheading.padding",
+                                                {
+                                                    "sticky": "nswe",
+                                                    "children": [
+                                                        ("Treeheading.image", {"side": "left", "sticky": ""}),
+                                                        ("Treeheading.text", {"sticky": "nswe"}),
+                                                    ],
+                                                },
+                                            )
+                                        ],
+                                    },
+                                )
+                            ],
+                        },
+                    )
+                ],
+            )
+
+        # Only the font options follow the zoom level; the colour options are
+        # installed with the static styles above.
+        self.option_add("*TCombobox*Listbox.font", ui_font)
+        self.option_add("*Font", ui_font)
 
         self._apply_log_theme()
         self._apply_setup_log_theme()
-        if hasattr(self, "help_text_area"):
-            self.help_text_area.configure(font=("Helvetica", self._scaled_size(10)))
+        if self.help_text_area is not None:
+            self.help_text_area.configure(font=self._font(FONT_TEXT, 10))
         self._update_nav_highlight()
         self._update_sidebar_toggle_text()
 
@@ -2407,12 +2283,28 @@ del "%~f0"
             textvariable=self.language_var,
             state="readonly",
             width=14,
+            postcommand=self._populate_language_values,
         )
         self.language_selector.pack(side="left")
         self.language_selector.bind("<<ComboboxSelected>>", self._on_language_change)
 
+        # Filled now so keyboard and mouse-wheel cycling work before the first open.
+        self._populate_language_values()
         self._refresh_language_options()
 
+    def _grid_translated_labels(
+        self, frame: ttk.Frame, layout: Iterable[Tuple[str, int, int, str]], padx: int = 5, pady: int = 5
+    ) -> None:
+        """Create, place and register the static labels described by ``layout``.
+
+        Labels are created without text; ``register_widget`` applies the
+        translation, so each label costs one configure instead of two.
+        """
+        for text_key, row, column, sticky in layout:
+            label = ttk.Label(frame)
+            label.grid(row=row, column=column, sticky=sticky, padx=padx, pady=pady)
+            self.register_widget(label, text_key)
+
     def create_section_card(self, parent: ttk.Frame, title_key: str) -> ttk.Labelframe:
         """Create a labeled card container for a tool section."""
 
@@ -2459,63 +2351,60 @@ del "%~f0"
 
         src_label = ttk.Label(copy_frame, text=self.tr("Source Folder:"))
         src_label.grid(row=0, column=0, sticky="w", padx=6, pady=6)
-        self.register_widget(src_label, "Source Folder:")
         ttk.Entry(copy_frame, textvariable=self.source_folder).grid(row=0, column=1, sticky="we", padx=6, pady=6)
-        src_browse = ttk.Button(
+        src_browse = self._make_browse_button(
             copy_frame,
-            text=self.tr("Browse..."),
-            command=lambda: self.source_folder.set(filedialog.askdirectory()),
+            command=functools.partial(self._browse_directory, self.source_folder),
         )
         src_browse.grid(row=0, column=2, sticky="e", padx=6, pady=6)
-        self.register_widget(src_browse, "Browse...")
 
         tgt_label = ttk.Label(copy_frame, text=self.tr("Target Folder:"))
         tgt_label.grid(row=1, column=0, sticky="w", padx=6, pady=6)
-        self.register_widget(tgt_label, "Target Folder:")
         ttk.Entry(copy_frame, textvariable=self.target_folder).grid(row=1, column=1, sticky="we", padx=6, pady=6)
-        tgt_browse = ttk.Button(
+        tgt_browse = self._make_browse_button(
             copy_frame,
-            text=self.tr("Browse..."),
-            command=lambda: self.target_folder.set(filedialog.askdirectory()),
+            command=functools.partial(self._browse_directory, self.target_folder),
         )
         tgt_browse.grid(row=1, column=2, sticky="e", padx=6, pady=6)
-        self.register_widget(tgt_browse, "Browse...")
 
         list_label = ttk.Label(copy_frame, text=self.tr("Numbers File (List):"))
         list_label.grid(row=2, column=0, sticky="w", padx=6, pady=6)
-        self.register_widget(list_label, "Numbers File (List):")
         ttk.Entry(copy_frame, textvariable=self.numbers_file).grid(row=2, column=1, sticky="we", padx=6, pady=6)
-        list_browse = ttk.Button(
+        list_browse = self._make_browse_button(
             copy_frame,
-            text=self.tr("Browse..."),
-            command=lambda: self.numbers_file.set(
-                filedialog.askopenfilename(
-                    filetypes=[
-                        ("Excel", "*.xlsx *.xls"),
-                        ("CSV/TXT", "*.csv *.txt"),
-                        ("All Files", "*.*"),
-                    ]
-                )
+            command=functools.partial(
+                self._browse_open_file,
+                self.numbers_file,
+                [
+                    ("Excel", "*.xlsx *.xls"),
+                    ("CSV/TXT", "*.csv *.txt"),
+                    ("All Files", "*.*"),
+                ],
             ),
         )
         list_browse.grid(row=2, column=2, sticky="e", padx=6, pady=6)
-        self.register_widget(list_browse, "Browse...")
 
         button_frame = ttk.Frame(copy_frame, style="PanelBody.TFrame")
         button_frame.grid(row=3, column=0, columnspan=3, sticky="w", padx=6, pady=(4, 6))
 
-        copy_button = ttk.Button(button_frame, text=self.tr("Copy Files"), command=lambda: self.start_process_files("copy"))
+        copy_button = ttk.Button(button_frame, text=self.tr("Copy Files"), command=functools.partial(self.start_process_files, "copy"))
         copy_button.pack(side="left")
-        self.register_widget(copy_button, "Copy Files")
 
-        move_button = ttk.Button(button_frame, text=self.tr("Move Files"), command=lambda: self.start_process_files("move"))
+        move_button = ttk.Button(button_frame, text=self.tr("Move Files"), command=functools.partial(self.start_process_files, "move"))
         move_button.pack(side="left", padx=(8, 0))
-        self.register_widget(move_button, "Move Files")
 
         save_button = ttk.Button(button_frame, text=self.tr("Save Settings"), command=self.save_folder_settings)
         save_button._text_icon_prefix = "⚙"
         save_button.pack(side="left", padx=(8, 0))
-        self.register_widget(save_button, "Save Settings")
+
+        self.register_widgets((
+            (src_label, "Source Folder:"),
+            (tgt_label, "Target Folder:"),
+            (list_label, "Numbers File (List):"),
+            (copy_button, "Copy Files"),
+            (move_button, "Move Files"),
+            (save_button, "Save Settings"),
+        ))
 
         heic_card = self.create_section_card(parent, "2. Convert HEIC/WEBP to JPG")
         heic_card.grid(row=1, column=0, sticky="nsew", padx=8, pady=8)
@@ -2525,19 +2414,20 @@ del "%~f0"
         self.heic_folder = tk.StringVar()
         heic_label = ttk.Label(heic_frame, text=self.tr("Folder with HEIC/WEBP files:"))
         heic_label.grid(row=0, column=0, sticky="w", padx=6, pady=6)
-        self.register_widget(heic_label, "Folder with HEIC/WEBP files:")
         ttk.Entry(heic_frame, textvariable=self.heic_folder).grid(row=0, column=1, sticky="we", padx=6, pady=6)
-        heic_browse = ttk.Button(
+        heic_browse = self._make_browse_button(
             heic_frame,
-            text=self.tr("Browse..."),
-            command=lambda: self.heic_folder.set(filedialog.askdirectory()),
+            command=functools.partial(self._browse_directory, self.heic_folder),
         )
         heic_browse.grid(row=0, column=2, sticky="e", padx=6, pady=6)
-        self.register_widget(heic_browse, "Browse...")
 
         heic_button = ttk.Button(heic_frame, text=self.tr("Convert"), command=self.start_heic_conversion)
         heic_button.grid(row=1, column=0, columnspan=3, sticky="w", padx=6, pady=(0, 6))
-        self.register_widget(heic_button, "Convert")
+
+        self.register_widgets((
+            (heic_label, "Folder with HEIC/WEBP files:"),
+            (heic_button, "Convert"),
+        ))
 
         resize_card = self.create_section_card(parent, "3. Batch Image Resizer")
         resize_card.grid(row=1, column=1, sticky="nsew", padx=8, pady=8)
@@ -2547,19 +2437,15 @@ del "%~f0"
         self.resize_folder = tk.StringVar()
         folder_label = ttk.Label(resize_frame, text=self.tr("Image Folder:"))
         folder_label.grid(row=0, column=0, sticky="w", padx=6, pady=6)
-        self.register_widget(folder_label, "Image Folder:")
         ttk.Entry(resize_frame, textvariable=self.resize_folder).grid(row=0, column=1, sticky="we", padx=6, pady=6)
-        folder_browse = ttk.Button(
+        folder_browse = self._make_browse_button(
             resize_frame,
-            text=self.tr("Browse..."),
-            command=lambda: self.resize_folder.set(filedialog.askdirectory()),
+            command=functools.partial(self._browse_directory, self.resize_folder),
         )
         folder_browse.grid(row=0, column=2, sticky="e", padx=6, pady=6)
-        self.register_widget(folder_browse, "Browse...")
 
         mode_label = ttk.Label(resize_frame, text=self.tr("Resize Mode:"))
         mode_label.grid(row=1, column=0, sticky="w", padx=6, pady=(6, 2))
-        self.register_widget(mode_label, "Resize Mode:")
 
         self.resize_mode = tk.StringVar(value="width")
         mode_frame = ttk.Frame(resize_frame, style="PanelBody.TFrame")
@@ -2573,7 +2459,6 @@ del "%~f0"
             command=self._update_resize_inputs,
         )
         width_radio.pack(side="left")
-        self.register_widget(width_radio, "By Width", attr="text")
 
         percent_radio = ttk.Radiobutton(
             mode_frame,
@@ -2583,32 +2468,46 @@ del "%~f0"
             command=self._update_resize_inputs,
         )
         percent_radio.pack(side="left", padx=(10, 0))
-        self.register_widget(percent_radio, "By Percentage", attr="text")
 
         self.max_width = tk.StringVar(value="1920")
         self.resize_percentage = tk.StringVar(value="80")
         self.quality = tk.StringVar(value="85")
+        # Reject non-digit keystrokes so start_resize_task only sees numbers.
+        digits_vcmd = (self.register(self._validate_digits), "%P")
 
         width_label = ttk.Label(resize_frame, text=self.tr("Max Width:"))
         width_label.grid(row=2, column=0, sticky="w", padx=6, pady=2)
-        self.register_widget(width_label, "Max Width:")
-        self.max_width_entry = ttk.Entry(resize_frame, textvariable=self.max_width, width=10)
+        self.max_width_entry = ttk.Entry(
+            resize_frame, textvariable=self.max_width, width=10, validate="key", validatecommand=digits_vcmd
+        )
         self.max_width_entry.grid(row=2, column=1, sticky="w", padx=6, pady=2)
 
         percent_label = ttk.Label(resize_frame, text=self.tr("Percentage (%):"))
         percent_label.grid(row=3, column=0, sticky="w", padx=6, pady=2)
-        self.register_widget(percent_label, "Percentage (%):")
-        self.resize_percentage_entry = ttk.Entry(resize_frame, textvariable=self.resize_percentage, width=10)
+        self.resize_percentage_entry = ttk.Entry(
+            resize_frame, textvariable=self.resize_percentage, width=10, validate="key", validatecommand=digits_vcmd
+        )
         self.resize_percentage_entry.grid(row=3, column=1, sticky="w", padx=6, pady=2)
 
         quality_label = ttk.Label(resize_frame, text=self.tr("JPEG Quality (1-95):"))
         quality_label.grid(row=4, column=0, sticky="w", padx=6, pady=2)
-        self.register_widget(quality_label, "JPEG Quality (1-95):")
-        ttk.Entry(resize_frame, textvariable=self.quality, width=10).grid(row=4, column=1, sticky="w", padx=6, pady=2)
+        ttk.Entry(
+            resize_frame, textvariable=self.quality, width=10, validate="key", validatecommand=digits_vcmd
+        ).grid(row=4, column=1, sticky="w", padx=6, pady=2)
 
         resize_button = ttk.Button(resize_frame, text=self.tr("Resize & Compress"), command=self.start_resize_task)
         resize_button.grid(row=5, column=0, columnspan=3, sticky="w", padx=6, pady=(6, 6))
-        self.register_widget(resize_button, "Resize & Compress")
+
+        self.register_widgets((
+            (folder_label, "Image Folder:"),
+            (mode_label, "Resize Mode:"),
+            (width_radio, "By Width"),
+            (percent_radio, "By Percentage"),
+            (width_label, "Max Width:"),
+            (percent_label, "Percentage (%):"),
+            (quality_label, "JPEG Quality (1-95):"),
+            (resize_button, "Resize & Compress"),
+        ))
 
         self._update_resize_inputs()
 
@@ -2632,9 +2531,8 @@ del "%~f0"
         
         ttk.Entry(frame, textvariable=self.color_palette_image_path, state="readonly").grid(row=0, column=1, sticky="we", padx=6, pady=10)
         
-        browse_btn = ttk.Button(frame, text=self.tr("Browse..."), command=self._select_color_palette_file)
+        browse_btn = self._make_browse_button(frame, self._select_color_palette_file)
         browse_btn.grid(row=0, column=2, sticky="e", padx=6, pady=10)
-        self.register_widget(browse_btn, "Browse...")
         
         extract_btn = ttk.Button(frame, text=self.tr("Extract Colors"), command=self._run_color_extraction, style="Accent.TButton")
         extract_btn.grid(row=1, column=0, columnspan=3, pady=10)
@@ -2682,8 +2580,8 @@ del "%~f0"
         info_sub.pack(side="left", fill="both", expand=True)
         
         ttk.Label(info_sub, textvariable=self.color_palette_current_name, font=self._font("Inter", 12, "bold")).pack(anchor="w")
-        ttk.Label(info_sub, textvariable=self.color_palette_current_hex, font=self._font("Cascadia Code", 10)).pack(anchor="w")
-        ttk.Label(info_sub, textvariable=self.color_palette_current_rgb, font=self._font("Cascadia Code", 10)).pack(anchor="w")
+        ttk.Label(info_sub, textvariable=self.color_palette_current_hex, font=self._mono_font(10)).pack(anchor="w")
+        ttk.Label(info_sub, textvariable=self.color_palette_current_rgb, font=self._mono_font(10)).pack(anchor="w")
 
         # Instruction
         msg = ttk.Label(iframe, text=self.tr("Move mouse over the image to pick a color."), font=self._font("Inter", 9, "italic"))
@@ -2788,7 +2686,7 @@ del "%~f0"
         # Run extraction in background to avoid freezing UI
         def worker():
             results = backend.extract_colors_task(path, num_colors=5)
-            self.after(0, lambda: self._update_color_palette_ui(results))
+            self.after(0, self._update_color_palette_ui, results)
             
         threading.Thread(target=worker, daemon=True).start()
 
@@ -2814,11 +2712,11 @@ del "%~f0"
             swatch.grid(row=row, column=0, padx=5, pady=5)
             
             # Hex string 
-            hex_lbl = ttk.Label(self.color_palette_container, text=hex_code, font=self._font("Cascadia Code", 10))
+            hex_lbl = ttk.Label(self.color_palette_container, text=hex_code, font=self._mono_font(10))
             hex_lbl.grid(row=row, column=1, padx=5, pady=5)
             
             # RGB string
-            rgb_lbl = ttk.Label(self.color_palette_container, text=rgb_val, font=self._font("Cascadia Code", 10))
+            rgb_lbl = ttk.Label(self.color_palette_container, text=rgb_val, font=self._mono_font(10))
             rgb_lbl.grid(row=row, column=2, padx=5, pady=5)
             
             # Name
@@ -2944,13 +2842,11 @@ del "%~f0"
         room_entry = ttk.Entry(frame, textvariable=self.view_in_room_room_path, state="readonly")
         room_entry.grid(row=0, column=1, sticky="we", padx=6, pady=6)
 
-        room_button = ttk.Button(
+        room_button = self._make_browse_button(
             frame,
-            text=self.tr("Browse..."),
-            command=lambda: self._select_view_in_room_file("room"),
+            command=functools.partial(self._select_view_in_room_file, "room"),
         )
         room_button.grid(row=0, column=2, sticky="e", padx=6, pady=6)
-        self.register_widget(room_button, "Browse...")
 
         rug_label = ttk.Label(frame, text=self.tr("Rug Image:"))
         rug_label.grid(row=1, column=0, sticky="w", padx=6, pady=6)
@@ -2959,13 +2855,11 @@ del "%~f0"
         rug_entry = ttk.Entry(frame, textvariable=self.view_in_room_rug_path, state="readonly")
         rug_entry.grid(row=1, column=1, sticky="we", padx=6, pady=6)
 
-        rug_button = ttk.Button(
+        rug_button = self._make_browse_button(
             frame,
-            text=self.tr("Browse..."),
-            command=lambda: self._select_view_in_room_file("rug"),
+            command=functools.partial(self._select_view_in_room_file, "rug"),
         )
         rug_button.grid(row=1, column=2, sticky="e", padx=6, pady=6)
-        self.register_widget(rug_button, "Browse...")
 
         controls_label = ttk.Label(
             frame,
@@ -2982,7 +2876,7 @@ del "%~f0"
         preview_button = ttk.Button(
             button_frame,
             text=self.tr("Generate Preview"),
-            command=lambda: self.generate_view_in_room_preview(reset_rug=True),
+            command=functools.partial(self.generate_view_in_room_preview, reset_rug=True),
         )
         preview_button.pack(side="left")
         self.register_widget(preview_button, "Generate Preview")
@@ -3197,13 +3091,13 @@ del "%~f0"
             index = len(self.view_in_room_manual_points)
             if index < 4:
                 key = f"Manual Prompt {index + 1}"
-                self.view_in_room_manual_prompt_var.set(self.tr(key))
+                self._set_var_if_changed(self.view_in_room_manual_prompt_var, self.tr(key))
             else:
-                self.view_in_room_manual_prompt_var.set("")
+                self._set_var_if_changed(self.view_in_room_manual_prompt_var, "")
         elif self.view_in_room_manual_relative_polygon:
-            self.view_in_room_manual_prompt_var.set(self.tr("Manual Placement Complete"))
+            self._set_var_if_changed(self.view_in_room_manual_prompt_var, self.tr("Manual Placement Complete"))
         else:
-            self.view_in_room_manual_prompt_var.set("")
+            self._set_var_if_changed(self.view_in_room_manual_prompt_var, "")
 
     def _start_manual_rug_placement(self) -> None:
         if not getattr(self, "view_in_room_preview_has_image", False):
@@ -3548,7 +3442,7 @@ del "%~f0"
                     cy,
                     text=symbol,
                     fill="#333333",
-                    font=("Segoe UI", 10, "bold"),
+                    font=(FONT_UI, 10, "bold"),
                 )
                 self.view_in_room_control_items[name] = (bg_id, text_id)
             self.view_in_room_icon_bounds[name] = (x_start, y_start, x_end, y_end)
@@ -4020,7 +3914,7 @@ del "%~f0"
         if int(round(float(self.view_in_room_mask_brush_size_var.get()))) != radius:
             self.view_in_room_mask_brush_size_var.set(radius)
         self.view_in_room_mask_brush_radius = radius
-        self.view_in_room_mask_brush_value_var.set(f"{radius} px")
+        self._set_var_if_changed(self.view_in_room_mask_brush_value_var, f"{radius} px")
         if (
             getattr(self, "view_in_room_mask_enabled_var", None)
             and self.view_in_room_mask_enabled_var.get()
@@ -4548,15 +4442,23 @@ del "%~f0"
 
     def tr(self, text_key):
         """Translate a text key according to the selected language."""
-        return translations.get(self.language, translations["en"]).get(text_key, text_key)
+        return _FLAT_TRANSLATIONS.get(self._lang_prefix + text_key, text_key)
 
     def update_language(self, lang: str) -> None:
         """Update the UI language immediately without restarting the app."""
         if lang not in translations:
             return
         self.language = lang
+        self._lang_prefix = f"{lang}\x00"
         self.settings["language"] = lang
-        save_settings(self.settings)
+        self._schedule_settings_save()
+        # Rapid switches collapse into one refresh once the event queue drains.
+        if not self._translation_refresh_pending:
+            self._translation_refresh_pending = True
+            self.after_idle(self._flush_translation_refresh)
+
+    def _flush_translation_refresh(self) -> None:
+        self._translation_refresh_pending = False
         self.refresh_translations()
 
     def tr_info(self, title_key: str) -> Optional[str]:
@@ -4569,15 +4471,17 @@ del "%~f0"
 
     def _update_resize_inputs(self):
         """Enable the relevant resize input fields according to the selected mode."""
-        if not hasattr(self, "resize_mode"):
+        max_width_entry = self.max_width_entry
+        percentage_entry = self.resize_percentage_entry
+        if self.resize_mode is None or max_width_entry is None or percentage_entry is None:
             return
-        max_width_entry = getattr(self, "max_width_entry", None)
-        percentage_entry = getattr(self, "resize_percentage_entry", None)
 
-        if max_width_entry is None or percentage_entry is None:
+        # Re-clicking the selected radio button leaves both entries as they are.
+        mode = self.resize_mode.get()
+        if mode == self._applied_resize_mode:
             return
-
-        if self.resize_mode.get() == "width":
+        self._applied_resize_mode = mode
+        if mode == "width":
             max_width_entry.config(state="normal")
             percentage_entry.config(state="disabled")
         else:
@@ -4586,8 +4490,39 @@ del "%~f0"
 
     def register_widget(self, widget, text_key, attr="text"):
         """Register a widget for translation updates."""
-        self.translatable_widgets.append((widget, attr, text_key))
-        self._apply_translation(widget, attr, text_key)
+        if attr == "text":
+            # [widget, key, last applied translation, icon decoration template]
+            entry = [widget, text_key, None, self._icon_template(widget)]
+            self._tr_text_widgets.append(entry)
+            self._apply_text_translation(entry, self.tr(text_key))
+        else:
+            self._tr_other_widgets.append((widget, attr, text_key))
+            self._apply_translation(widget, attr, text_key)
+
+    @staticmethod
+    def _icon_template(widget: tk.Misc) -> Optional[str]:
+        """Return a format string adding the widget's icon prefix/suffix, if any."""
+        prefix = getattr(widget, "_text_icon_prefix", "")
+        suffix = getattr(widget, "_text_icon_suffix", "")
+        if not (prefix or suffix):
+            return None
+        return " ".join(part for part in (prefix, "{}", suffix) if part)
+
+    def register_widgets(self, widgets: Iterable[Tuple[tk.Misc, str]]) -> None:
+        """Register ``(widget, text_key)`` pairs whose text is already ``tr(text_key)``.
+
+        Because the widgets were created with their translated text, only
+        icon-decorated ones need a configure here; the rest just record it.
+        """
+        tr = self.tr
+        entries = []
+        for widget, text_key in widgets:
+            template = self._icon_template(widget)
+            entry = [widget, text_key, tr(text_key), template]
+            if template is not None:
+                self._apply_text_translation(entry, entry[2])
+            entries.append(entry)
+        self._tr_text_widgets.extend(entries)
 
     def register_tooltip(self, widget: tk.Misc, text_key: str) -> Tooltip:
         """Attach a localized tooltip to a widget."""
@@ -4596,69 +4531,87 @@ del "%~f0"
             self.tr(text_key),
             background=self.theme_colors.get("tooltip_bg", "#111c2e"),
             foreground=self.theme_colors.get("tooltip_fg", "#f1f5f9"),
-            font=self._font("Segoe UI", 9),
+            font=self._font(FONT_UI, 9),
         )
         self.registered_tooltips.append((tooltip, text_key))
         return tooltip
 
     def _apply_translation(self, widget, attr, text_key):
         try:
-            value = self.tr(text_key)
-            if attr == "text":
-                prefix = getattr(widget, "_text_icon_prefix", "")
-                suffix = getattr(widget, "_text_icon_suffix", "")
-                if prefix:
-                    value = f"{prefix} {value}"
-                if suffix:
-                    value = f"{value} {suffix}"
-            widget.configure(**{attr: value})
+            widget.configure(**{attr: self.tr(text_key)})
+        except tk.TclError:
+            pass
+
+    @staticmethod
+    def _apply_text_translation(entry: List[Any], value: str) -> None:
+        entry[2] = value
+        if entry[3] is not None:
+            value = entry[3].format(value)
+        try:
+            entry[0].configure(text=value)
         except tk.TclError:
             pass
 
     def refresh_translations(self):
         """Refresh UI texts according to the currently selected language."""
-        self.title(f"{self.tr('Combined Utility Tool')} v{__version__}")
-        if hasattr(self, "header_title"):
-            self.header_title.config(text=f"{self.tr('Combined Utility Tool')} v{__version__}")
-        if hasattr(self, "header_subtitle"):
-            self.header_subtitle.config(text=self.tr("Welcome to the Combined Utility Tool!"))
-        for widget, attr, text_key in self.translatable_widgets:
-            self._apply_translation(widget, attr, text_key)
+        tr = self.tr
+        title = f"{tr('Combined Utility Tool')} v{__version__}"
+        self.title(title)
+        if self.header_title is not None:
+            self.header_title.config(text=title)
+        if self.header_subtitle is not None:
+            self.header_subtitle.config(text=tr("Welcome to the Combined Utility Tool!"))
+        apply_text = self._apply_text_translation
+        for entry in self._tr_text_widgets:
+            value = tr(entry[1])
+            # Same-language refreshes and strings shared by both languages
+            # ("SKU:", "MSRP:") need no Tcl round-trip.
+            if value != entry[2]:
+                apply_text(entry, value)
+        for widget, attr, text_key in self._tr_other_widgets:
+            try:
+                widget.configure(**{attr: tr(text_key)})
+            except tk.TclError:
+                pass
         for tooltip, text_key in self.registered_tooltips:
-            tooltip.update_text(self.tr(text_key))
+            tooltip.update_text(tr(text_key))
+        tr_info = self.tr_info
         for label, title_key in self.section_descriptions:
-            info_text = self.tr_info(title_key)
-            if info_text:
-                label.configure(text=info_text)
-            else:
-                label.configure(text="")
+            label.configure(text=tr_info(title_key) or "")
         if hasattr(self, "section_notebook"):
+            notebook_tab = self.section_notebook.tab
             for frame, title_key in self.notebook_tabs:
-                self.section_notebook.tab(frame, text=self.tr(title_key))
+                notebook_tab(frame, text=tr(title_key))
         self.update_help_tab_content()
-        if hasattr(self, "rug_control_tree"):
-            self.populate_rug_no_control_tree(getattr(self, "rug_control_results", []))
+        if self.rug_control_tree is not None:
+            self._retranslate_rug_no_control_tree()
         if hasattr(self, "view_in_room_canvas") and not self.view_in_room_preview_has_image:
             self._show_view_in_room_message(self.tr("Preview will appear here."))
         self._update_manual_prompt_label()
         self._update_sidebar_toggle_text()
-        if hasattr(self, "update_status_var"):
-            self._refresh_update_status_text()
-        if hasattr(self, "rinven_image_folder_value"):
+        self._refresh_update_status_text()
+        if self.rinven_image_folder_value is not None:
             self._update_rinven_image_folder_display()
         self._refresh_language_options()
 
     def _refresh_language_options(self):
-        """Update language combobox options according to current translations."""
-        if not hasattr(self, "language_selector"):
+        """Show the current language in the combobox; the list is retranslated on open."""
+        if self.language_selector is None:
             return
-        values = [self.tr(key) for key in self.language_options.values()]
         self._updating_language_selector = True
-        self.language_selector.configure(values=values)
         current_display = self.tr(self.language_options.get(self.language, "English"))
         self.language_var.set(current_display)
         self._updating_language_selector = False
 
+    def _populate_language_values(self) -> None:
+        """Fill the dropdown list, retranslating it at most once per language."""
+        if self._language_values_for == self.language:
+            return
+        self._language_values_for = self.language
+        self.language_selector.configure(
+            values=[self.tr(key) for key in self.language_options.values()]
+        )
+
     def _on_language_change(self, event=None):
         """Handle user selection of a different UI language."""
         if self._updating_language_selector:
@@ -4680,11 +4633,15 @@ del "%~f0"
             self._refresh_language_options()
 
     def update_help_tab_content(self):
-        if hasattr(self, "help_text_area"):
+        if self.help_text_area is not None:
+            # The text only depends on the language; skip the Tcl delete/insert
+            # round-trip when it is already rendered.
+            if self._help_rendered_language == self.language:
+                return
+            self._help_rendered_language = self.language
             self.help_text_area.config(state=tk.NORMAL)
             self.help_text_area.delete("1.0", tk.END)
-            help_content = self.tr("ABOUT_CONTENT").format(version=__version__)
-            self.help_text_area.insert(tk.END, help_content)
+            self.help_text_area.insert(tk.END, _about_content(self.language))
             self.help_text_area.config(state=tk.DISABLED)
 
     def create_google_maps_scraper_tab(self, parent: ttk.Frame) -> None:
@@ -4730,7 +4687,7 @@ del "%~f0"
             self.clipboard_append(self.donation_btc_address)
             success_text = self.tr("Donation address copied to clipboard.")
             self.log(success_text)
-            messagebox.showinfo(self.tr("Support & Donate"), success_text)
+            self.show_toast(success_text)
         except tk.TclError:
             pass
 
@@ -4739,12 +4696,18 @@ del "%~f0"
         try:
             try:
                 self._persist_view_preferences()
+                self._flush_settings_save()
             except Exception:
                 pass
             try:
                 self.scanner_speech_queue.stop()
             except Exception:
                 pass
+            try:
+                updater.close_session()
+            except Exception:
+                pass
+            self._stop_background_tasks()
             
             # Auto-update application replacement on exit
             if hasattr(self, "_staged_update_bat") and self._staged_update_bat and os.path.exists(self._staged_update_bat):
@@ -4785,13 +4748,11 @@ del "%~f0"
         format_label.grid(row=0, column=0, sticky="w", padx=6, pady=6)
         self.register_widget(format_label, "Excel/CSV/TXT File:")
         ttk.Entry(format_frame, textvariable=self.format_file).grid(row=0, column=1, sticky="we", padx=6, pady=6)
-        format_browse = ttk.Button(
+        format_browse = self._make_browse_button(
             format_frame,
-            text=self.tr("Browse..."),
-            command=lambda: self.format_file.set(filedialog.askopenfilename()),
+            command=functools.partial(self._browse_open_file, self.format_file),
         )
         format_browse.grid(row=0, column=2, sticky="e", padx=6, pady=6)
-        self.register_widget(format_browse, "Browse...")
         format_button = ttk.Button(format_frame, text=self.tr("Format"), command=self.start_format_numbers)
         format_button.grid(row=0, column=3, padx=6, pady=6)
         self.register_widget(format_button, "Format")
@@ -4905,7 +4866,7 @@ del "%~f0"
         rug_button = ttk.Button(single_rug_frame, text=self.tr("Calculate"), command=self.calculate_single_rug)
         rug_button.grid(row=0, column=2, padx=6, pady=6)
         self.register_widget(rug_button, "Calculate")
-        ttk.Label(single_rug_frame, textvariable=self.rug_result_label, font=("Helvetica", 10, "bold")).grid(
+        ttk.Label(single_rug_frame, textvariable=self.rug_result_label, font=(FONT_TEXT, 10, "bold")).grid(
             row=1,
             column=0,
             columnspan=3,
@@ -4925,13 +4886,11 @@ del "%~f0"
         bulk_file_label.grid(row=0, column=0, padx=6, pady=6, sticky="w")
         self.register_widget(bulk_file_label, "Excel/CSV File:")
         ttk.Entry(bulk_rug_frame, textvariable=self.bulk_rug_file).grid(row=0, column=1, padx=6, pady=6, sticky="we")
-        bulk_browse = ttk.Button(
+        bulk_browse = self._make_browse_button(
             bulk_rug_frame,
-            text=self.tr("Browse..."),
-            command=lambda: self.bulk_rug_file.set(filedialog.askopenfilename()),
+            command=functools.partial(self._browse_open_file, self.bulk_rug_file),
         )
         bulk_browse.grid(row=0, column=2, padx=6, pady=6)
-        self.register_widget(bulk_browse, "Browse...")
 
         bulk_col_label = ttk.Label(bulk_rug_frame, text=self.tr("Column Name/Letter:"))
         bulk_col_label.grid(row=1, column=0, padx=6, pady=6, sticky="w")
@@ -4950,6 +4909,7 @@ del "%~f0"
         self.unit_in_var = tk.StringVar()
         self.unit_ft_var = tk.StringVar()
         self._unit_update_in_progress = False
+        self._unit_change_after: Optional[str] = None
 
         unit_rows = [
             ("Centimeters (cm):", self.unit_cm_var, "cm"),
@@ -4962,10 +4922,10 @@ del "%~f0"
             self.register_widget(label, label_key)
             entry = ttk.Entry(unit_frame, textvariable=var)
             entry.grid(row=row_index, column=1, sticky="we", padx=6, pady=6)
-            entry.bind("<KeyRelease>", lambda _event, key=unit_key: self._on_unit_field_change(key))
+            entry.bind("<KeyRelease>", lambda _event, key=unit_key: self._queue_unit_field_change(key))
             entry.bind("<FocusOut>", lambda _event, key=unit_key: self._on_unit_field_change(key))
-            entry.bind("<<Paste>>", lambda _event, key=unit_key: self._on_unit_field_change(key))
-            entry.bind("<<Cut>>", lambda _event, key=unit_key: self._on_unit_field_change(key))
+            entry.bind("<<Paste>>", lambda _event, key=unit_key: self._queue_unit_field_change(key))
+            entry.bind("<<Cut>>", lambda _event, key=unit_key: self._queue_unit_field_change(key))
 
         image_link_card = self.create_section_card(parent, "8. Match Image Links")
         image_link_card.grid(row=6, column=0, columnspan=2, sticky="nsew", padx=8, pady=8)
@@ -4981,27 +4941,25 @@ del "%~f0"
         source_file_label.grid(row=0, column=0, padx=5, pady=5, sticky="w")
         self.register_widget(source_file_label, "Source Excel/CSV File:")
         ttk.Entry(image_link_frame, textvariable=self.input_excel_file, width=50).grid(row=0, column=1, padx=5, pady=5)
-        source_browse = ttk.Button(
+        source_browse = self._make_browse_button(
             image_link_frame,
-            text=self.tr("Browse..."),
-            command=lambda: self.input_excel_file.set(
-                filedialog.askopenfilename(filetypes=[("Excel files", "*.xlsx *.xls"), ("CSV files", "*.csv")])
+            command=functools.partial(
+                self._browse_open_file,
+                self.input_excel_file,
+                [("Excel files", "*.xlsx *.xls"), ("CSV files", "*.csv")],
             ),
         )
         source_browse.grid(row=0, column=2, padx=5, pady=5)
-        self.register_widget(source_browse, "Browse...")
 
         image_links_label = ttk.Label(image_link_frame, text=self.tr("Image Links File (CSV):"))
         image_links_label.grid(row=1, column=0, padx=5, pady=5, sticky="w")
         self.register_widget(image_links_label, "Image Links File (CSV):")
         ttk.Entry(image_link_frame, textvariable=self.image_links_file, width=50).grid(row=1, column=1, padx=5, pady=5)
-        image_links_browse = ttk.Button(
+        image_links_browse = self._make_browse_button(
             image_link_frame,
-            text=self.tr("Browse..."),
-            command=lambda: self.image_links_file.set(filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])),
+            command=functools.partial(self._browse_open_file, self.image_links_file, [("CSV files", "*.csv")]),
         )
         image_links_browse.grid(row=1, column=2, padx=5, pady=5)
-        self.register_widget(image_links_browse, "Browse...")
 
         key_column_label = ttk.Label(image_link_frame, text=self.tr("Key Column Name/Letter:"))
         key_column_label.grid(row=2, column=0, padx=5, pady=5, sticky="w")
@@ -5035,13 +4993,11 @@ del "%~f0"
             padx=6,
             pady=6,
         )
-        sold_browse = ttk.Button(
+        sold_browse = self._make_browse_button(
             input_frame,
-            text=self.tr("Browse..."),
-            command=lambda: self._browse_rug_file(self.rug_control_sold_path),
+            command=functools.partial(self._browse_rug_file, self.rug_control_sold_path),
         )
         sold_browse.grid(row=0, column=4, sticky="e", padx=6, pady=6)
-        self.register_widget(sold_browse, "Browse...")
 
         inventory_label = ttk.Label(input_frame, text=self.tr("Reference List:"))
         inventory_label.grid(row=1, column=0, sticky="w", padx=6, pady=6)
@@ -5055,13 +5011,11 @@ del "%~f0"
             padx=6,
             pady=6,
         )
-        inventory_browse = ttk.Button(
+        inventory_browse = self._make_browse_button(
             input_frame,
-            text=self.tr("Browse..."),
-            command=lambda: self._browse_rug_file(self.rug_control_inventory_path),
+            command=functools.partial(self._browse_rug_file, self.rug_control_inventory_path),
         )
         inventory_browse.grid(row=1, column=4, sticky="e", padx=6, pady=6)
-        self.register_widget(inventory_browse, "Browse...")
 
         check_button = ttk.Button(
             input_frame,
@@ -5193,22 +5147,39 @@ del "%~f0"
         return normalized_values
 
     def populate_rug_no_control_tree(self, results: List[Tuple[str, bool]]):
-        tree = getattr(self, "rug_control_tree", None)
+        tree = self.rug_control_tree
         if tree is None:
             return None
 
         tree.heading("rug_no", text=self.tr("ID"))
         tree.heading("status", text=self.tr("Status"))
 
-        for item in tree.get_children():
-            tree.delete(item)
+        tree.delete(*tree.get_children())
 
+        # Indexed by the boolean "found" flag.
+        status_texts = (self.tr("RUG_NO_CONTROL_NOT_FOUND"), self.tr("RUG_NO_CONTROL_FOUND"))
+        insert = tree.insert
         for original, found in results:
-            status_text = self.tr("RUG_NO_CONTROL_FOUND") if found else self.tr("RUG_NO_CONTROL_NOT_FOUND")
-            tree.insert("", "end", values=(original, status_text))
+            insert("", "end", values=(original, status_texts[bool(found)]))
 
         return tree
 
+    def _retranslate_rug_no_control_tree(self) -> None:
+        """Update headings and status cells in place after a language change."""
+        tree = self.rug_control_tree
+        results = self.rug_control_results
+        items = tree.get_children()
+        if len(items) != len(results):
+            self.populate_rug_no_control_tree(results)
+            return
+
+        tree.heading("rug_no", text=self.tr("ID"))
+        tree.heading("status", text=self.tr("Status"))
+        found_text = self.tr("RUG_NO_CONTROL_FOUND")
+        not_found_text = self.tr("RUG_NO_CONTROL_NOT_FOUND")
+        for item, (_original, found) in zip(items, results):
+            tree.set(item, "status", found_text if found else not_found_text)
+
     def export_rug_no_control_excel(self) -> None:
         results = getattr(self, "rug_control_results", [])
         if not results:
@@ -5376,7 +5347,7 @@ del "%~f0"
         self.register_widget(save_button, "Save Pricing")
 
     def _update_rinven_image_folder_display(self) -> None:
-        value_var = getattr(self, "rinven_image_folder_value", None)
+        value_var = self.rinven_image_folder_value
         if value_var is None:
             return
         folder_path = self.rinven_import_settings.get("image_folder", "")
@@ -5389,13 +5360,14 @@ del "%~f0"
             return
         selected = set(tree.selection())
         focus_item = tree.focus()
-        for item in tree.get_children():
-            tree.delete(item)
+        tree.delete(*tree.get_children())
+        insert = tree.insert
         for index, row in enumerate(self.rinven_import_rows):
             values = [row.get(column, "") for column in RINVEN_IMPORT_COLUMNS]
             tag = "even" if index % 2 == 0 else "odd"
-            tree.insert("", "end", iid=str(index), values=values, tags=(tag,))
-        available_items = set(tree.get_children(""))
+            insert("", "end", iid=str(index), values=values, tags=(tag,))
+        # Row iids are the row indices, so there is no need to ask Tk for them.
+        available_items = {str(index) for index in range(len(self.rinven_import_rows))}
         new_selection = [item for item in selected if item in available_items]
         if new_selection:
             tree.selection_set(new_selection)
@@ -5523,7 +5495,7 @@ del "%~f0"
         save_settings(self.settings)
         message = self.tr("Pricing settings saved.")
         self.log(message)
-        messagebox.showinfo(self.tr("Success"), message)
+        self.show_toast(message)
 
     def _open_rinven_paste_dialog(self) -> None:
         dialog = tk.Toplevel(self)
@@ -5729,7 +5701,7 @@ del "%~f0"
         self._save_rinven_import_rows()
         message = self.tr("Auto size applied to {count} rows.").format(count=updated)
         self.log(message)
-        messagebox.showinfo(self.tr("Success"), message)
+        self.show_toast(message)
 
     def _apply_rinven_size_to_row(self, index: int) -> bool:
         row = self.rinven_import_rows[index]
@@ -5752,7 +5724,7 @@ del "%~f0"
         self._save_rinven_import_rows()
         message = self.tr("Auto pricing applied to {count} rows.").format(count=updated)
         self.log(message)
-        messagebox.showinfo(self.tr("Success"), message)
+        self.show_toast(message)
 
     def _apply_rinven_price_to_row(self, index: int) -> bool:
         row = self.rinven_import_rows[index]
@@ -5785,7 +5757,7 @@ del "%~f0"
             count=len(indices),
         )
         self.log(message)
-        messagebox.showinfo(self.tr("Success"), message)
+        self.show_toast(message)
 
     def _export_rinven_wayfair_format(self) -> None:
         if not self.rinven_import_rows:
@@ -5959,12 +5931,14 @@ del "%~f0"
         parent.columnconfigure(1, weight=1)
 
         def toggle_dymo_options(output_var, combobox, entry):
+            # ttk state flags mirror what configure(state=...) would set, but
+            # each widget is updated with a single state() call.
             if output_var.get() == "Dymo":
-                combobox.config(state="readonly")
-                entry.config(state="normal")
+                combobox.state(("!disabled", "readonly"))
+                entry.state(("!disabled", "!readonly"))
             else:
-                combobox.config(state="disabled")
-                entry.config(state="disabled")
+                combobox.state(("disabled", "!readonly"))
+                entry.state(("disabled", "!readonly"))
 
         qr_card = self.create_section_card(parent, "8. QR Code Generator")
         qr_card.grid(row=0, column=0, sticky="nsew", padx=8, pady=8)
@@ -5976,30 +5950,27 @@ del "%~f0"
         self.qr_data = tk.StringVar()
         self.qr_filename = tk.StringVar(value="qrcode.png")
         self.qr_output_type = tk.StringVar(value="PNG")
-        self.qr_dymo_size = tk.StringVar(value=list(DYMO_LABELS.keys())[0])
+        self.qr_dymo_size = tk.StringVar(value=DYMO_LABEL_KEYS[0])
+        self._qr_dymo_info = DYMO_LABELS[DYMO_LABEL_KEYS[0]]
+        self.qr_dymo_size.trace_add("write", self._on_qr_dymo_size_change)
         self.qr_bottom_text = tk.StringVar()
 
-        qr_data_label = ttk.Label(qr_frame, text=self.tr("Data/URL:"))
-        qr_data_label.grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        self.register_widget(qr_data_label, "Data/URL:")
+        self._grid_translated_labels(qr_frame, QR_LABEL_LAYOUT)
         ttk.Entry(qr_frame, textvariable=self.qr_data, width=60).grid(row=0, column=1, columnspan=3, padx=5, pady=5)
 
-        qr_output_label = ttk.Label(qr_frame, text=self.tr("Output Type:"))
-        qr_output_label.grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        self.register_widget(qr_output_label, "Output Type:")
-
         qr_radio_frame = ttk.Frame(qr_frame, style="PanelBody.TFrame")
         qr_radio_frame.grid(row=1, column=1, columnspan=3, sticky="w")
 
-        qr_dymo_combo = ttk.Combobox(qr_frame, textvariable=self.qr_dymo_size, values=list(DYMO_LABELS.keys()), state="disabled", width=30)
+        qr_dymo_combo = ttk.Combobox(qr_frame, textvariable=self.qr_dymo_size, values=DYMO_LABEL_KEYS, state="disabled", width=30)
         qr_bottom_entry = ttk.Entry(qr_frame, textvariable=self.qr_bottom_text, state="disabled", width=32)
+        qr_toggle_dymo = functools.partial(toggle_dymo_options, self.qr_output_type, qr_dymo_combo, qr_bottom_entry)
 
         qr_png_radio = ttk.Radiobutton(
             qr_radio_frame,
             text=self.tr("Standard PNG"),
             variable=self.qr_output_type,
             value="PNG",
-            command=lambda: toggle_dymo_options(self.qr_output_type, qr_dymo_combo, qr_bottom_entry),
+            command=qr_toggle_dymo,
         )
         qr_png_radio.pack(side="left", padx=5)
         self.register_widget(qr_png_radio, "Standard PNG")
@@ -6009,24 +5980,13 @@ del "%~f0"
             text=self.tr("Dymo Label"),
             variable=self.qr_output_type,
             value="Dymo",
-            command=lambda: toggle_dymo_options(self.qr_output_type, qr_dymo_combo, qr_bottom_entry),
+            command=qr_toggle_dymo,
         )
         qr_dymo_radio.pack(side="left", padx=5)
         self.register_widget(qr_dymo_radio, "Dymo Label")
 
-        qr_dymo_label = ttk.Label(qr_frame, text=self.tr("Dymo Size:"))
-        qr_dymo_label.grid(row=2, column=0, sticky="w", padx=5, pady=5)
-        self.register_widget(qr_dymo_label, "Dymo Size:")
         qr_dymo_combo.grid(row=2, column=1, padx=5, pady=5, sticky="w")
-
-        qr_bottom_label = ttk.Label(qr_frame, text=self.tr("Bottom Text:"))
-        qr_bottom_label.grid(row=2, column=2, sticky="e", padx=5, pady=5)
-        self.register_widget(qr_bottom_label, "Bottom Text:")
         qr_bottom_entry.grid(row=2, column=3, padx=5, pady=5, sticky="w")
-
-        qr_filename_label = ttk.Label(qr_frame, text=self.tr("Filename:"))
-        qr_filename_label.grid(row=3, column=0, sticky="w", padx=5, pady=5)
-        self.register_widget(qr_filename_label, "Filename:")
         ttk.Entry(qr_frame, textvariable=self.qr_filename, width=60).grid(row=3, column=1, columnspan=3, padx=5, pady=5)
 
         qr_button = ttk.Button(qr_frame, text=self.tr("Generate QR Code"), command=self.start_generate_qr)
@@ -6043,35 +6003,28 @@ del "%~f0"
         self.bc_filename = tk.StringVar(value="barcode.png")
         self.bc_type = tk.StringVar(value='code128')
         self.bc_output_type = tk.StringVar(value="PNG")
-        self.bc_dymo_size = tk.StringVar(value=list(DYMO_LABELS.keys())[0])
+        self.bc_dymo_size = tk.StringVar(value=DYMO_LABEL_KEYS[0])
+        self._bc_dymo_info = DYMO_LABELS[DYMO_LABEL_KEYS[0]]
+        self.bc_dymo_size.trace_add("write", self._on_bc_dymo_size_change)
         self.bc_bottom_text = tk.StringVar()
 
-        bc_data_label = ttk.Label(bc_frame, text=self.tr("Data:"))
-        bc_data_label.grid(row=0, column=0, sticky="w", padx=5, pady=5)
-        self.register_widget(bc_data_label, "Data:")
+        self._grid_translated_labels(bc_frame, BARCODE_LABEL_LAYOUT)
         ttk.Entry(bc_frame, textvariable=self.bc_data, width=40).grid(row=0, column=1, padx=5, pady=5, sticky="w")
-
-        bc_format_label = ttk.Label(bc_frame, text=self.tr("Format:"))
-        bc_format_label.grid(row=0, column=2, sticky="e", padx=5, pady=5)
-        self.register_widget(bc_format_label, "Format:")
         ttk.Combobox(bc_frame, textvariable=self.bc_type, values=['code39', 'code128', 'ean13', 'upca'], state="readonly", width=15).grid(row=0, column=3, padx=5, pady=5, sticky="w")
 
-        bc_output_label = ttk.Label(bc_frame, text=self.tr("Output Type:"))
-        bc_output_label.grid(row=1, column=0, sticky="w", padx=5, pady=5)
-        self.register_widget(bc_output_label, "Output Type:")
-
         bc_radio_frame = ttk.Frame(bc_frame, style="PanelBody.TFrame")
         bc_radio_frame.grid(row=1, column=1, columnspan=3, sticky="w")
 
-        bc_dymo_combo = ttk.Combobox(bc_frame, textvariable=self.bc_dymo_size, values=list(DYMO_LABELS.keys()), state="disabled", width=30)
+        bc_dymo_combo = ttk.Combobox(bc_frame, textvariable=self.bc_dymo_size, values=DYMO_LABEL_KEYS, state="disabled", width=30)
         bc_bottom_entry = ttk.Entry(bc_frame, textvariable=self.bc_bottom_text, state="disabled", width=32)
+        bc_toggle_dymo = functools.partial(toggle_dymo_options, self.bc_output_type, bc_dymo_combo, bc_bottom_entry)
 
         bc_png_radio = ttk.Radiobutton(
             bc_radio_frame,
             text=self.tr("Standard PNG"),
             variable=self.bc_output_type,
             value="PNG",
-            command=lambda: toggle_dymo_options(self.bc_output_type, bc_dymo_combo, bc_bottom_entry),
+            command=bc_toggle_dymo,
         )
         bc_png_radio.pack(side="left", padx=5)
         self.register_widget(bc_png_radio, "Standard PNG")
@@ -6081,24 +6034,13 @@ del "%~f0"
             text=self.tr("Dymo Label"),
             variable=self.bc_output_type,
             value="Dymo",
-            command=lambda: toggle_dymo_options(self.bc_output_type, bc_dymo_combo, bc_bottom_entry),
+            command=bc_toggle_dymo,
         )
         bc_dymo_radio.pack(side="left", padx=5)
         self.register_widget(bc_dymo_radio, "Dymo Label")
 
-        bc_dymo_label = ttk.Label(bc_frame, text=self.tr("Dymo Size:"))
-        bc_dymo_label.grid(row=2, column=0, sticky="w", padx=5, pady=5)
-        self.register_widget(bc_dymo_label, "Dymo Size:")
         bc_dymo_combo.grid(row=2, column=1, padx=5, pady=5, sticky="w")
-
-        bc_bottom_label = ttk.Label(bc_frame, text=self.tr("Bottom Text:"))
-        bc_bottom_label.grid(row=2, column=2, sticky="e", padx=5, pady=5)
-        self.register_widget(bc_bottom_label, "Bottom Text:")
         bc_bottom_entry.grid(row=2, column=3, padx=5, pady=5, sticky="w")
-
-        bc_filename_label = ttk.Label(bc_frame, text=self.tr("Filename:"))
-        bc_filename_label.grid(row=3, column=0, sticky="w", padx=5, pady=5)
-        self.register_widget(bc_filename_label, "Filename:")
         ttk.Entry(bc_frame, textvariable=self.bc_filename, width=60).grid(row=3, column=1, columnspan=3, padx=5, pady=5)
 
         bc_button = ttk.Button(bc_frame, text=self.tr("Generate Barcode"), command=self.start_generate_barcode)
@@ -6132,6 +6074,27 @@ del "%~f0"
         self.rinven_font_size = tk.StringVar(value="20")
         self.rinven_price_font_size = tk.StringVar()
         self.rinven_msrp_font_size = tk.StringVar()
+        # Snapshot tables for _collect_rinven_details, built once.
+        self._rinven_text_vars: Tuple[Tuple[str, tk.StringVar], ...] = (
+            ("price", self.rinven_price),
+            ("msrp", self.rinven_msrp),
+            ("collection", self.rinven_collection),
+            ("design", self.rinven_design),
+            ("color", self.rinven_color),
+            ("size", self.rinven_size),
+            ("origin", self.rinven_origin),
+            ("style", self.rinven_style),
+            ("content", self.rinven_content),
+            ("type", self.rinven_type),
+            ("area", self.rinven_area),
+            ("sku", self.rinven_sku),
+            ("rug_no", self.rinven_rug_no),
+        )
+        self._rinven_font_vars: Tuple[Tuple[str, tk.StringVar], ...] = (
+            ("font_size", self.rinven_font_size),
+            ("price_font_size", self.rinven_price_font_size),
+            ("msrp_font_size", self.rinven_msrp_font_size),
+        )
         self.rinven_bulk_font_size = tk.StringVar(value="20")
         self.rinven_include_barcode = tk.BooleanVar(value=False)
         self.rinven_only_filled = tk.BooleanVar(value=True)
@@ -6176,11 +6139,13 @@ del "%~f0"
             ("rug_no", "Rug #:", self.rinven_rug_no),
         ]
 
+        # register_widget applies the translation, so labels start without text.
+        history_root = self.settings.get("rinven_history", {})
         for field_key, label_key, var in fields:
-            label = ttk.Label(frame, text=self.tr(label_key))
+            label = ttk.Label(frame)
             label.grid(row=row, column=0, sticky="e", padx=6, pady=4)
             self.register_widget(label, label_key)
-            history_values = self.settings.get("rinven_history", {}).get(field_key, [])
+            history_values = history_root.get(field_key, ())
             combobox = ttk.Combobox(
                 frame,
                 textvariable=var,
@@ -6344,13 +6309,11 @@ del "%~f0"
         bulk_file_entry = ttk.Entry(frame, textvariable=self.rinven_bulk_file)
         bulk_file_entry.grid(row=row, column=1, sticky="we", padx=6, pady=4)
 
-        bulk_file_button = ttk.Button(
+        bulk_file_button = self._make_browse_button(
             frame,
-            text=self.tr("Browse..."),
             command=self._select_rinven_bulk_file,
         )
         bulk_file_button.grid(row=row, column=2, sticky="e", padx=6, pady=4)
-        self.register_widget(bulk_file_button, "Browse...")
         row += 1
 
         output_label = ttk.Label(frame, text=self.tr("Output Folder:"))
@@ -6360,13 +6323,11 @@ del "%~f0"
         output_entry = ttk.Entry(frame, textvariable=self.rinven_bulk_output)
         output_entry.grid(row=row, column=1, sticky="we", padx=6, pady=4)
 
-        output_button = ttk.Button(
+        output_button = self._make_browse_button(
             frame,
-            text=self.tr("Browse..."),
             command=self._select_rinven_bulk_output,
         )
         output_button.grid(row=row, column=2, sticky="e", padx=6, pady=4)
-        self.register_widget(output_button, "Browse...")
         row += 1
 
         output_format_label = ttk.Label(frame, text=self.tr("Output Format:"))
@@ -6404,7 +6365,7 @@ del "%~f0"
         self.rinven_bulk_label_size_combo = ttk.Combobox(
             frame,
             textvariable=self.rinven_label_size_var,
-            values=list(RINVEN_DYMO_LABEL_SIZES.keys()),
+            values=RINVEN_DYMO_LABEL_KEYS,
             state="disabled",
             style="Light.TCombobox",
         )
@@ -6612,16 +6573,16 @@ del "%~f0"
             )
             
             if success:
-                self.after(0, lambda: messagebox.showinfo(self.tr("Success"), self.tr("Macro finished successfully.")))
+                self.after(0, messagebox.showinfo, self.tr("Success"), self.tr("Macro finished successfully."))
             else:
-                self.after(0, lambda: messagebox.showerror(self.tr("Error"), message))
+                self.after(0, messagebox.showerror, self.tr("Error"), message)
         
         except Exception as e:
-            self.after(0, lambda: messagebox.showerror(self.tr("Error"), f"Macro error: {e}"))
+            self.after(0, messagebox.showerror, self.tr("Error"), f"Macro error: {e}")
         
         finally:
             self.inventory_macro_running = False
-            self.after(0, lambda: self.inventory_macro_button.config(state="normal"))
+            self.after(0, functools.partial(self.inventory_macro_button.config, state="normal"))
 
 
     def create_about_panel(self, parent: ttk.Frame):
@@ -6688,22 +6649,9 @@ del "%~f0"
             height=6,
             padx=10,
             pady=10,
-            font=("Cascadia Code", self._scaled_size(9)),
+            font=self._mono_font(9),
         )
-        self.setup_log_area.configure(
-            background=self.theme_colors["card_bg"],
-            foreground=self.theme_colors["text_primary"],
-            insertbackground=self.theme_colors["text_primary"],
-            highlightthickness=0,
-            borderwidth=0,
-        )
-        try:
-            self.setup_log_area.configure(
-                disabledforeground=self.theme_colors["text_primary"],
-                disabledbackground=self.theme_colors["card_bg"],
-            )
-        except tk.TclError:
-            pass
+        self._apply_text_area_theme(self.setup_log_area)
         self.setup_log_area.configure(state=tk.DISABLED)
         self.setup_log_area.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=6, pady=(0, 6))
         setup_body.rowconfigure(2, weight=1)
@@ -6746,7 +6694,7 @@ del "%~f0"
         
         # Adding a trace to the update status to show/hide the "Update now" button
         def on_status_change(*_):
-            state = getattr(self, "_update_status_state", "idle")
+            state, _context = self._update_status
             if state == "update_available":
                 self.update_now_button.pack(side="right")
             else:
@@ -6755,29 +6703,20 @@ del "%~f0"
         self.update_status_var.trace_add("write", on_status_change)
         on_status_change() # Initial check
 
+        # The help text is built by _build_help_text_area when the tab is first shown.
+        self._help_text_frame = frame
+
+    def _build_help_text_area(self) -> None:
         self.help_text_area = ScrolledText(
-            frame,
+            self._help_text_frame,
             wrap=tk.WORD,
             padx=10,
             pady=10,
-            font=("Helvetica", self._scaled_size(10)),
+            font=self._font(FONT_TEXT, 10),
         )
-        self.help_text_area.configure(
-            background=self.theme_colors["card_bg"],
-            foreground=self.theme_colors["text_primary"],
-            insertbackground=self.theme_colors["text_primary"],
-            highlightthickness=0,
-            borderwidth=0,
-        )
-        try:
-            self.help_text_area.configure(
-                disabledforeground=self.theme_colors["text_primary"],
-                disabledbackground=self.theme_colors["card_bg"],
-            )
-        except tk.TclError:
-            # Some Tk builds do not support disabled foreground/background options.
-            pass
+        self._apply_text_area_theme(self.help_text_area)
         self.help_text_area.pack(fill="both", expand=True)
+        self._help_rendered_language = None
         self.update_help_tab_content()
 
     def start_dependency_setup(self) -> None:
@@ -6840,10 +6779,10 @@ del "%~f0"
         return response["value"]
 
     def _setup_log_callback(self, message: str) -> None:
-        self.after(0, lambda: self._append_setup_log(message))
+        self.after(0, self._append_setup_log, message)
 
     def _setup_progress_callback(self, value: int) -> None:
-        self.after(0, lambda: self.setup_progress_var.set(value))
+        self.after(0, self.setup_progress_var.set, value)
 
     def _clear_setup_log(self) -> None:
         if not hasattr(self, "setup_log_area"):
@@ -6870,46 +6809,85 @@ del "%~f0"
         self.settings['target_folder'] = tgt
         save_settings(self.settings)
         self.log(self.tr("✅ Settings saved to settings.json"))
-        messagebox.showinfo(self.tr("Success"), self.tr("Folder settings have been saved."))
+        self.show_toast(self.tr("Folder settings have been saved."))
 
     def start_process_files(self, action):
         src = self.source_folder.get()
         tgt = self.target_folder.get()
         nums_f = self.numbers_file.get()
-        if not all([src, tgt, nums_f]):
-            messagebox.showerror(self.tr("Error"), self.tr("Please specify Source, Target, and Numbers File."))
+        if not (src and tgt and nums_f):
+            self.show_toast(self.tr("Please specify Source, Target, and Numbers File."), level="error")
             return
         self.run_in_thread(backend.process_files_task, src, tgt, nums_f, action, self.log, self.task_completion_popup)
 
     def start_heic_conversion(self):
         folder = self.heic_folder.get()
         if not folder or not os.path.isdir(folder):
-            messagebox.showerror(self.tr("Error"), self.tr("Please select a valid folder."))
+            self.show_toast(self.tr("Please select a valid folder."), level="error")
             return
         self.run_in_thread(backend.convert_heic_task, folder, self.log, self.task_completion_popup)
 
     def start_resize_task(self):
         src_folder = self.resize_folder.get()
         if not src_folder or not os.path.isdir(src_folder):
-            messagebox.showerror(self.tr("Error"), self.tr("Please select a valid image folder."))
+            self.show_toast(self.tr("Please select a valid image folder."), level="error")
             return
         mode = self.resize_mode.get()
-        try:
-            value = int(self.max_width.get()) if mode == 'width' else int(self.resize_percentage.get())
-            quality = int(self.quality.get())
-            if not (value > 0 and 1 <= quality <= 95):
-                raise ValueError
-        except ValueError:
-            messagebox.showerror(self.tr("Error"), self.tr("Resize values and quality must be valid numbers."))
+        value = self._parse_bounded_int(self.max_width if mode == 'width' else self.resize_percentage, 1)
+        quality = self._parse_bounded_int(self.quality, 1, 95)
+        if value is None or quality is None:
+            self.show_toast(self.tr("Resize values and quality must be valid numbers."), level="error")
             return
         self.run_in_thread(backend.resize_images_task, src_folder, mode, value, quality, self.log, self.task_completion_popup)
 
+    @staticmethod
+    def _validate_digits(proposed: str) -> bool:
+        return proposed == "" or proposed.isdecimal()
+
+    @staticmethod
+    def _set_var_if_changed(var: tk.Variable, value: Any) -> bool:
+        """Set ``var`` only when its value differs; return whether it was written.
+
+        Writing a Tk variable redraws every bound widget and fires its traces,
+        which is wasted work when refreshes keep producing the same value.
+        """
+        if var.get() == value:
+            return False
+        var.set(value)
+        return True
+
+    @staticmethod
+    def _fill_missing(target: Dict[str, Any], defaults: Dict[str, Any]) -> bool:
+        """Add any keys of ``defaults`` missing from ``target``; return whether any were."""
+        missing = defaults.keys() - target.keys()
+        for key in missing:
+            target[key] = defaults[key]
+        return bool(missing)
+
+    @staticmethod
+    def _parse_bounded_int(variable: tk.Variable, minimum: int, maximum: Optional[int] = None) -> Optional[int]:
+        """Return the variable's integer value, or None when invalid or out of range."""
+        raw = str(variable.get()).strip()
+        if not raw.isdecimal():
+            return None
+        value = int(raw)
+        if value < minimum or (maximum is not None and value > maximum):
+            return None
+        return value
+
     def start_format_numbers(self):
         file_path = self.format_file.get()
         if not file_path:
-            messagebox.showerror(self.tr("Error"), self.tr("Please select a file."))
+            self.show_toast(self.tr("Please select a file."), level="error")
             return
+        self.run_in_thread(self._format_numbers_worker, file_path)
+
+    def _format_numbers_worker(self, file_path: str) -> None:
+        # pandas file parsing runs here; results are shown on the UI thread.
         err, success_msg = backend.format_numbers_task(file_path)
+        self.after_idle(self._format_numbers_done, err, success_msg)
+
+    def _format_numbers_done(self, err: Optional[str], success_msg: Optional[str]) -> None:
         if err:
             self.log(self.tr("Error: {message}").format(message=err))
             messagebox.showerror(self.tr("Error"), err)
@@ -6933,10 +6911,29 @@ del "%~f0"
         path = self.bulk_rug_file.get()
         col = self.bulk_rug_col.get()
         if not path or not col:
-            messagebox.showerror(self.tr("Error"), self.tr("Please select a file and specify a column."))
+            self.show_toast(self.tr("Please select a file and specify a column."), level="error")
             return
         self.run_in_thread(backend.bulk_rug_sizer_task, path, col, self.log, self.task_completion_popup)
 
+    def _make_browse_button(self, parent: tk.Misc, command: Callable[[], None]) -> ttk.Button:
+        """Create a registered "Browse..." button; the caller places it."""
+        button = ttk.Button(parent, command=command)
+        self.register_widget(button, "Browse...")
+        return button
+
+    def _browse_directory(self, variable: tk.StringVar) -> None:
+        folder = filedialog.askdirectory()
+        if folder:
+            variable.set(folder)
+
+    def _browse_open_file(
+        self, variable: tk.StringVar, filetypes: Optional[List[Tuple[str, str]]] = None
+    ) -> None:
+        options = {"filetypes": filetypes} if filetypes else {}
+        file_path = filedialog.askopenfilename(**options)
+        if file_path:
+            variable.set(file_path)
+
     def _browse_rug_file(self, variable: tk.StringVar) -> None:
         file_path = filedialog.askopenfilename(
             filetypes=[
@@ -7005,7 +7002,7 @@ del "%~f0"
         self.scanner_speech_settings["enabled"] = bool(self.scanner_speak_enabled_var.get())
         self.scanner_speech_settings["speak_digits"] = bool(self.scanner_speak_digits_var.get())
         self.scanner_speech_settings["feedback_mode"] = self.scanner_speak_feedback_var.get()
-        save_settings(self.settings)
+        self._schedule_settings_save()
 
     def _enqueue_scanner_speech(self, text: str, *, success: bool) -> None:
         if not self.scanner_speak_enabled_var.get():
@@ -7063,9 +7060,23 @@ del "%~f0"
                 self.tr("Error"), self.tr("File could not be saved: {error}").format(error=exc)
             )
 
+    def _cancel_unit_field_change(self) -> None:
+        if self._unit_change_after is not None:
+            try:
+                self.after_cancel(self._unit_change_after)
+            except tk.TclError:
+                pass
+            self._unit_change_after = None
+
+    def _queue_unit_field_change(self, source_unit: str) -> None:
+        """Collapse a burst of keystrokes into a single conversion."""
+        self._cancel_unit_field_change()
+        self._unit_change_after = self.after(150, self._on_unit_field_change, source_unit)
+
     def _on_unit_field_change(self, source_unit: str) -> None:
         """Synchronize unit inputs when one of the fields changes."""
 
+        self._cancel_unit_field_change()
         if getattr(self, "_unit_update_in_progress", False):
             return
 
@@ -7124,8 +7135,8 @@ del "%~f0"
         input_path = self.input_excel_file.get()
         links_path = self.image_links_file.get()
         key_col = self.key_column.get()
-        if not all([input_path, links_path, key_col]):
-            messagebox.showerror(self.tr("Error"), self.tr("Please fill in all file paths and the column name."))
+        if not (input_path and links_path and key_col):
+            self.show_toast(self.tr("Please fill in all file paths and the column name."), level="error")
             return
         self.run_in_thread(
             backend.add_image_links_task,
@@ -7136,35 +7147,57 @@ del "%~f0"
             self.task_completion_popup,
         )
 
+    def _on_qr_dymo_size_change(self, *_args) -> None:
+        # Resolved once per selection instead of on every Generate click.
+        self._qr_dymo_info = DYMO_LABELS.get(self.qr_dymo_size.get(), self._qr_dymo_info)
+
+    def _on_bc_dymo_size_change(self, *_args) -> None:
+        self._bc_dymo_info = DYMO_LABELS.get(self.bc_dymo_size.get(), self._bc_dymo_info)
+
     def start_generate_qr(self):
         data = self.qr_data.get()
         fname = self.qr_filename.get()
         if not data or not fname:
-            messagebox.showerror(self.tr("Error"), self.tr("Data and filename are required."))
+            self.show_toast(self.tr("Data and filename are required."), level="error")
             return
-        dymo_info = DYMO_LABELS[self.qr_dymo_size.get()] if self.qr_output_type.get() == "Dymo" else None
-        log_msg, success_msg = backend.generate_qr_task(data, fname, self.qr_output_type.get(), dymo_info, self.qr_bottom_text.get())
-        self.log(log_msg)
-        if success_msg:
-            self.task_completion_popup("Success", success_msg)
-        else:
-            messagebox.showerror(self.tr("Error"), log_msg)
+        output_type = self.qr_output_type.get()
+        dymo_info = self._qr_dymo_info if output_type == "Dymo" else None
+        self.run_in_thread(
+            self._run_generation_task,
+            backend.generate_qr_task,
+            data,
+            fname,
+            output_type,
+            dymo_info,
+            self.qr_bottom_text.get(),
+        )
 
     def start_generate_barcode(self):
         data = self.bc_data.get()
         fname = self.bc_filename.get()
         if not data or not fname:
-            messagebox.showerror(self.tr("Error"), self.tr("Data and filename are required."))
+            self.show_toast(self.tr("Data and filename are required."), level="error")
             return
-        dymo_info = DYMO_LABELS[self.bc_dymo_size.get()] if self.bc_output_type.get() == "Dymo" else None
-        log_msg, success_msg = backend.generate_barcode_task(
+        output_type = self.bc_output_type.get()
+        dymo_info = self._bc_dymo_info if output_type == "Dymo" else None
+        self.run_in_thread(
+            self._run_generation_task,
+            backend.generate_barcode_task,
             data,
             fname,
             self.bc_type.get(),
-            self.bc_output_type.get(),
+            output_type,
             dymo_info,
             self.bc_bottom_text.get() or data,
         )
+
+    def _run_generation_task(self, task: Callable[..., Tuple[str, Optional[str]]], *args: Any) -> None:
+        # Rendering and saving happen on the pool; the log line and dialog are
+        # then emitted together in one idle callback on the UI thread.
+        log_msg, success_msg = task(*args)
+        self.after_idle(self._report_generation_result, log_msg, success_msg)
+
+    def _report_generation_result(self, log_msg: str, success_msg: Optional[str]) -> None:
         self.log(log_msg)
         if success_msg:
             self.task_completion_popup("Success", success_msg)
@@ -7195,24 +7228,10 @@ del "%~f0"
         return " ".join(text.split()).strip()
 
     def _collect_rinven_details(self) -> Dict[str, str]:
-        return {
-            "price": self._normalize_rinven_value(self.rinven_price.get()),
-            "msrp": self._normalize_rinven_value(self.rinven_msrp.get()),
-            "collection": self._normalize_rinven_value(self.rinven_collection.get()),
-            "design": self._normalize_rinven_value(self.rinven_design.get()),
-            "color": self._normalize_rinven_value(self.rinven_color.get()),
-            "size": self._normalize_rinven_value(self.rinven_size.get()),
-            "origin": self._normalize_rinven_value(self.rinven_origin.get()),
-            "style": self._normalize_rinven_value(self.rinven_style.get()),
-            "content": self._normalize_rinven_value(self.rinven_content.get()),
-            "type": self._normalize_rinven_value(self.rinven_type.get()),
-            "area": self._normalize_rinven_value(self.rinven_area.get()),
-            "sku": self._normalize_rinven_value(self.rinven_sku.get()),
-            "rug_no": self._normalize_rinven_value(self.rinven_rug_no.get()),
-            "font_size": self.rinven_font_size.get(),
-            "price_font_size": self.rinven_price_font_size.get(),
-            "msrp_font_size": self.rinven_msrp_font_size.get(),
-        }
+        normalize = self._normalize_rinven_value
+        details = {key: normalize(var.get()) for key, var in self._rinven_text_vars}
+        details.update((key, var.get()) for key, var in self._rinven_font_vars)
+        return details
 
     def _queue_rinven_preview_update(self, *_args):
         if self._rinven_preview_after is not None:
@@ -7222,9 +7241,10 @@ del "%~f0"
                 pass
         self._rinven_preview_after = self.after(120, self._update_rinven_preview)
 
-    def _update_rinven_preview(self):
+    def _update_rinven_preview(self, details: Optional[Dict[str, str]] = None):
         self._rinven_preview_after = None
-        details = self._collect_rinven_details()
+        if details is None:
+            details = self._collect_rinven_details()
         include_barcode_flag = self.rinven_include_barcode.get()
         barcode_text = self.rinven_barcode_var.get()
         barcode_value = self._normalize_rinven_value(barcode_text)
@@ -7332,11 +7352,13 @@ del "%~f0"
         self._set_rinven_warning(messages)
 
     def _set_rinven_warning(self, messages: List[str]):
-        if messages:
-            self.rinven_warning_var.set("\n".join(dict.fromkeys(messages)))
+        # Called on every preview refresh; leave the label alone when unchanged.
+        text = "\n".join(dict.fromkeys(messages))
+        if not self._set_var_if_changed(self.rinven_warning_var, text):
+            return
+        if text:
             self.rinven_warning_label.grid()
         else:
-            self.rinven_warning_var.set("")
             self.rinven_warning_label.grid_remove()
 
     def _rinven_refresh_printers(self):
@@ -7361,10 +7383,11 @@ del "%~f0"
         size_key = self.rinven_label_size_var.get()
         info = RINVEN_DYMO_LABEL_SIZES.get(size_key)
         if info is None:
-            default_key = next(iter(RINVEN_DYMO_LABEL_SIZES))
+            default_key = RINVEN_DYMO_LABEL_KEYS[0]
             self.rinven_label_size_var.set(default_key)
             info = RINVEN_DYMO_LABEL_SIZES[default_key]
-        return float(info.get("w_in", 0.0)), float(info.get("h_in", 0.0))
+        w_in, h_in = info
+        return float(w_in), float(h_in)
 
     def _get_bulk_output_format(self) -> str:
         output_format = (self.rinven_bulk_output_format.get() or "").strip().lower()
@@ -7413,30 +7436,35 @@ del "%~f0"
 
     def update_rinven_history(self, details: dict):
         history = self.settings.setdefault("rinven_history", {})
-        updated = False
+        dirty_fields: List[str] = []
 
         for field_key, value in details.items():
             if not value:
                 continue
 
-            stored_values = history.setdefault(field_key, [])
-
-            if value in stored_values:
-                if stored_values[0] != value:
-                    stored_values.remove(value)
-                    stored_values.insert(0, value)
-                    updated = True
-            else:
-                stored_values.insert(0, value)
-                updated = True
-
-            if len(stored_values) > 10:
-                del stored_values[10:]
+            stored_values = history.get(field_key) or []
+            if stored_values and stored_values[0] == value:
+                continue
 
-        if updated:
-            save_settings(self.settings)
-            for key, combobox in self.rinven_field_widgets.items():
-                combobox["values"] = history.get(key, [])
+            # Move (or add) the value to the front and trim in a single pass.
+            # History stays a plain list so settings.json can serialise it.
+            mru = [value]
+            for existing in stored_values:
+                if len(mru) >= RINVEN_HISTORY_LIMIT:
+                    break
+                if existing != value:
+                    mru.append(existing)
+            history[field_key] = mru
+            dirty_fields.append(field_key)
+
+        if dirty_fields:
+            self._schedule_settings_save()
+            # Only the comboboxes whose history changed need new values.
+            field_widgets = self.rinven_field_widgets
+            for key in dirty_fields:
+                combobox = field_widgets.get(key)
+                if combobox is not None:
+                    combobox["values"] = tuple(history[key])
 
     def _run_rinven_tag_generation(
         self, output_format: str, label_size_in: Optional[Tuple[float, float]] = None
@@ -7468,7 +7496,7 @@ del "%~f0"
             except tk.TclError:
                 pass
             self._rinven_preview_after = None
-        self._update_rinven_preview()
+        self._update_rinven_preview(details)
         metadata = self.rinven_preview_metadata or {"warnings": [], "has_content": False}
 
         if not metadata.get("has_content"):
@@ -7542,7 +7570,7 @@ del "%~f0"
         size_combo = ttk.Combobox(
             dialog,
             textvariable=self.rinven_label_size_var,
-            values=list(RINVEN_DYMO_LABEL_SIZES.keys()),
+            values=RINVEN_DYMO_LABEL_KEYS,
             state="readonly",
         )
         size_combo.grid(row=1, column=1, columnspan=2, sticky="we", padx=10, pady=4)
@@ -8104,7 +8132,7 @@ class UpdateCountdownDialog(tk.Toplevel):
         try:
             self.lift()
             self.attributes("-topmost", True)
-            self.after(100, lambda: self.attributes("-topmost", False))
+            self.after(100, self.attributes, "-topmost", False)
         except tk.TclError:
             pass
 
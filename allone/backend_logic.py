@@ -1,4 +1,5 @@
 # backend_logic.py
+import functools
 import os
 import re
 import sys
@@ -7,18 +8,20 @@ import shutil
 import tempfile
 import traceback
 import platform
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import pandas as pd
 from PIL import Image, ImageDraw, ImageFont, ImageOps
-import pillow_heif
 import qrcode
 import time
 import pyautogui
 pyautogui.FAILSAFE = True  # Move mouse to top-left corner to stop
 
+from allone import heic_converter
+
 try:
     import win32print  # type: ignore
 except ImportError:  # pragma: no cover - platform dependent
@@ -234,11 +237,18 @@ def calculate_sqft(s: str):
         return round(w * h, 2) if w is not None and h is not None else None
     except: return None
     
+@functools.lru_cache(maxsize=None)
+def dymo_px(width_in: float, height_in: float, dpi: int = 300) -> Tuple[int, int]:
+    """Return the pixel size of a ``width_in`` x ``height_in`` label at ``dpi``."""
+    return int(width_in * dpi), int(height_in * dpi)
+
 def create_label_image(code_image, label_info, bottom_text=""):
-    """Creates a label image for Dymo printers with a centered code and optional text."""
+    """Creates a label image for Dymo printers with a centered code and optional text.
+
+    ``label_info`` is a ``(width_in, height_in)`` tuple.
+    """
     DPI = 300
-    label_width_px = int(label_info['w_in'] * DPI)
-    label_height_px = int(label_info['h_in'] * DPI)
+    label_width_px, label_height_px = dymo_px(*label_info, DPI)
     label_bg = Image.new('RGB', (label_width_px, label_height_px), 'white')
     padding = int(0.1 * DPI)
     text_area_height = int(0.25 * DPI) if bottom_text else 0
@@ -350,8 +360,14 @@ def process_files_task(src, tgt, nums_f, action, log_callback, completion_callba
     completion_callback("Complete", f"File {action} process finished. See log for details.")
 
 
-def convert_heic_task(folder, log_callback, completion_callback):
-    """Converts all HEIC and WEBP files in a folder to JPG."""
+def convert_heic_task(folder, log_callback, completion_callback, max_workers: Optional[int] = None):
+    """Converts all HEIC and WEBP files in a folder to JPG.
+
+    With more than one worker the files are decoded in separate processes
+    (default: one per CPU core but one), so conversions do not contend for
+    the interpreter lock. main.py calls multiprocessing.freeze_support() so
+    this also works in the frozen executable.
+    """
     log_callback("Starting HEIC/WEBP to JPG conversion...")
     try:
         files = [
@@ -364,33 +380,27 @@ def convert_heic_task(folder, log_callback, completion_callback):
             log_callback("No HEIC or WEBP files found."); return
 
         total_files = len(files)
-        for i, f in enumerate(files):
-            log_callback(f"Converting ({i+1}/{total_files}): {f}")
-            src, dst = os.path.join(folder, f), f"{os.path.splitext(os.path.join(folder, f))[0]}.jpg"
-            try:
-                img = None
-                ext = os.path.splitext(f)[1].lower()
-                if ext == ".heic":
-                    heif = pillow_heif.read_heif(src)
-                    img = Image.frombytes(heif.mode, heif.size, heif.data, "raw")
-                else:
-                    with Image.open(src) as opened:
-                        if opened.mode not in ("RGB", "L"):
-                            img = opened.convert("RGB")
-                        else:
-                            img = opened.copy()
+        if max_workers is None:
+            max_workers = (os.cpu_count() or 1) - 1
+        max_workers = max(1, min(max_workers, total_files))
+        log_callback(f"Converting {total_files} file(s) with {max_workers} worker(s)...")
 
-                if img.mode in ("RGBA", "P"):
-                    img = img.convert("RGB")
-
-                img.save(dst, "JPEG")
-            except Exception as e: log_callback(f"Error converting '{f}': {e}")
-            finally:
-                if img is not None:
-                    try:
-                        img.close()
-                    except Exception:
-                        pass
+        # A single worker converts in this thread; spawning a process would only add startup cost.
+        executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+        try:
+            if executor is None:
+                outcomes = ((f, heic_converter.convert_file(folder, f)) for f in files)
+            else:
+                futures = {executor.submit(heic_converter.convert_file, folder, f): f for f in files}
+                outcomes = ((futures[future], future.result()) for future in as_completed(futures))
+            for i, (f, error) in enumerate(outcomes, 1):
+                if error:
+                    log_callback(f"Error converting ({i}/{total_files}) '{f}': {error}")
+                else:
+                    log_callback(f"Converted ({i}/{total_files}): {f}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         log_callback("\n✅ Conversion complete.")
         completion_callback("Success", "HEIC/WEBP conversion is complete.")
@@ -0,0 +1,43 @@
+"""Single-file HEIC/WEBP to JPG conversion used by ``convert_heic_task``.
+
+Kept out of ``backend_logic`` so the worker processes that run it only
+import Pillow and pillow_heif, not the GUI automation and pandas stack.
+"""
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+import pillow_heif
+from PIL import Image
+
+
+def convert_file(folder: str, name: str) -> Optional[str]:
+    """Convert ``folder/name`` to a JPG next to it; returns the error text on failure."""
+    src = os.path.join(folder, name)
+    dst = f"{os.path.splitext(src)[0]}.jpg"
+    img = None
+    try:
+        if os.path.splitext(name)[1].lower() == ".heic":
+            heif = pillow_heif.read_heif(src)
+            img = Image.frombytes(heif.mode, heif.size, heif.data, "raw")
+        else:
+            with Image.open(src) as opened:
+                if opened.mode not in ("RGB", "L"):
+                    img = opened.convert("RGB")
+                else:
+                    img = opened.copy()
+
+        if img.mode in ("RGBA", "P"):
+            img = img.convert("RGB")
+
+        img.save(dst, "JPEG")
+        return None
+    except Exception as e:
+        return str(e)
+    finally:
+        if img is not None:
+            try:
+                img.close()
+            except Exception:
+                pass
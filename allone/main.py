@@ -1,4 +1,5 @@
 # main.py
+import multiprocessing
 import subprocess
 import sys
 
@@ -8,6 +9,9 @@ def install_and_check():
 
 
 if __name__ == "__main__":
+    # Worker processes (HEIC conversion) re-run the frozen exe; this hands them off.
+    multiprocessing.freeze_support()
+
     # Eğer program bir .exe olarak derlenmişse, bu kontrolü atla.
     # 'sys.frozen' özelliği sadece PyInstaller .exe'lerinde bulunur.
     if not getattr(sys, 'frozen', False):
@@ -1,20 +1,43 @@
 # settings_manager.py
+import hashlib
 import json
 import os
 
 SETTINGS_FILE = "settings.json"
 
+# Digest of the settings as last read from or written to disk.
+_last_saved_digest = None
+
+def _digest(serialized: str) -> bytes:
+    return hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).digest()
+
 def load_settings() -> dict:
     """Loads settings from the JSON file."""
+    global _last_saved_digest
     if os.path.exists(SETTINGS_FILE):
         try:
             with open(SETTINGS_FILE, "r", encoding='utf-8') as f:
-                return json.load(f)
+                settings = json.load(f)
         except json.JSONDecodeError:
             return {}
+        _last_saved_digest = _digest(json.dumps(settings, indent=4))
+        return settings
     return {}
 
 def save_settings(settings: dict):
-    """Saves the settings dictionary to the JSON file."""
-    with open(SETTINGS_FILE, "w", encoding='utf-8') as f:
-        json.dump(settings, f, indent=4)
+    """Saves the settings dictionary to the JSON file.
+
+    The write is skipped when the settings are unchanged since the last
+    load or save. The file is written to a temporary sibling and swapped
+    in with os.replace so an interrupted write never leaves it truncated.
+    """
+    global _last_saved_digest
+    serialized = json.dumps(settings, indent=4)
+    digest = _digest(serialized)
+    if digest == _last_saved_digest:
+        return
+    tmp_path = SETTINGS_FILE + ".tmp"
+    with open(tmp_path, "w", encoding='utf-8') as f:
+        f.write(serialized)
+    os.replace(tmp_path, SETTINGS_FILE)
+    _last_saved_digest = digest
@@ -3,47 +3,113 @@ from __future__ import annotations
 
 import json
 import logging
-import requests
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from allone.version import __version__
 
+if TYPE_CHECKING:
+    import requests
+
 OWNER = "hakanakaslanx-code"
 REPO = "allone"
 GITHUB_API_URL = f"https://api.github.com/repos/{OWNER}/{REPO}/releases/latest"
 
-def check_for_updates(timeout: int = 5) -> Optional[Dict[str, Any]]:
+_HTTP_SESSION: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session so repeated calls reuse keep-alive connections.
+
+    ``requests`` is imported here rather than at module level so the UI can
+    start without paying for it; the first call happens on a worker thread.
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+
+        session = requests.Session()
+        session.headers.update({"User-Agent": f"AllOne/{__version__}"})
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+def close_session() -> None:
+    """Close the shared HTTP session, if one was opened."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is not None:
+        _HTTP_SESSION.close()
+        _HTTP_SESSION = None
+
+
+def check_for_updates(
+    timeout: int = 5,
+    session: Optional[requests.Session] = None,
+    cache: Optional[Dict[str, Any]] = None,
+    raise_errors: bool = False,
+) -> Optional[Dict[str, Any]]:
     """Check GitHub for the latest release version.
     
     Returns a dictionary with 'version', 'url', and 'notes' if a newer version 
     exists, otherwise returns None.
+
+    ``cache`` is an optional dict holding the previous response's ``etag`` and
+    trimmed ``release``; it is sent as ``If-None-Match`` so an unchanged release
+    comes back as an empty 304, and is updated in place after a fresh fetch.
+
+    With ``raise_errors`` a failed request is re-raised instead of being
+    reported as None, so callers can tell "no newer release" from "unknown".
     """
     try:
-        response = requests.get(GITHUB_API_URL, timeout=timeout)
-        response.raise_for_status()
-        data = response.json()
-        
-        remote_version = data.get("tag_name", "").lstrip("v")
+        session = session or get_session()
+        headers = {}
+        if cache and cache.get("etag") and cache.get("release"):
+            headers["If-None-Match"] = cache["etag"]
+        response = session.get(GITHUB_API_URL, timeout=timeout, headers=headers)
+        if response.status_code == 304:
+            release = cache["release"]
+        else:
+            response.raise_for_status()
+            release = _trim_release(response.json())
+            if cache is not None:
+                cache.clear()
+                if response.headers.get("ETag"):
+                    cache["etag"] = response.headers["ETag"]
+                    cache["release"] = release
+
+        remote_version = release.get("tag_name", "").lstrip("v")
         if not remote_version:
             return None
             
         if _is_newer(remote_version, __version__):
-            download_url = None
-            for asset in data.get("assets", []):
-                if asset.get("name", "").endswith(".exe"):
-                    download_url = asset.get("browser_download_url")
-                    break
-
             return {
                 "version": remote_version,
-                "url": data.get("html_url"),
-                "notes": data.get("body", ""),
-                "download_url": download_url
+                "url": release.get("html_url"),
+                "notes": release.get("body", ""),
+                "download_url": release.get("download_url"),
             }
     except Exception as e:
         logging.error(f"Failed to check for updates: {e}")
+        if raise_errors:
+            raise
         
     return None
 
+def _trim_release(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the release fields used by ``check_for_updates``."""
+    download_url = None
+    for asset in data.get("assets", []):
+        if asset.get("name", "").endswith(".exe"):
+            download_url = asset.get("browser_download_url")
+            break
+    return {
+        "tag_name": data.get("tag_name", ""),
+        "html_url": data.get("html_url"),
+        "body": data.get("body", ""),
+        "download_url": download_url,
+    }
+
 def _is_newer(remote: str, local: str) -> bool:
     """Simple version comparison."""
     try:
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+app_ui = pytest.importorskip("allone.app_ui")
+
+
+class _FakeApp:
+    """Stands in for ToolApp: defers after() callbacks like Tk and records statuses."""
+
+    def __init__(self):
+        self.update_settings = {}
+        self.statuses = []
+        self.pending = []
+
+    def after(self, _ms, callback, *args):
+        self.pending.append((callback, args))
+
+    def run_pending(self):
+        while self.pending:
+            callback, args = self.pending.pop(0)
+            callback(*args)
+
+    def _set_update_status(self, state, **context):
+        self.statuses.append((state, context))
+
+
+class _FailingSession:
+    def __init__(self, error):
+        self.error = error
+
+    def get(self, _url, timeout=None, headers=None):
+        raise self.error
+
+
+@pytest.mark.parametrize(
+    ("error", "state"),
+    [
+        (requests.Timeout("read timed out"), "timeout"),
+        (requests.ConnectionError("offline"), "error"),
+    ],
+)
+def test_failed_update_check_reports_status_and_is_not_cached(monkeypatch, error, state):
+    monkeypatch.setattr(app_ui.updater, "get_session", lambda: _FailingSession(error))
+    app = _FakeApp()
+
+    app_ui.ToolApp._run_safe_update_check(app, None, {})
+    app.run_pending()
+
+    assert app.statuses == [(state, {"error": str(error)})]
+    assert "last_check" not in app.update_settings
@@ -0,0 +1,49 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _ensure_repo_on_path() -> None:
+    repo_root = Path(__file__).resolve().parents[1]
+    repo_str = str(repo_root)
+    if repo_str not in sys.path:
+        sys.path.insert(0, repo_str)
+
+
+@pytest.fixture()
+def settings_module(monkeypatch, tmp_path):
+    _ensure_repo_on_path()
+    module = importlib.reload(importlib.import_module("allone.settings_manager"))
+    monkeypatch.setattr(module, "SETTINGS_FILE", str(tmp_path / "settings.json"))
+    return module
+
+
+def test_save_settings_skips_unchanged_write(settings_module, monkeypatch):
+    settings_module.save_settings({"language": "tr"})
+
+    writes = []
+    real_open = open
+
+    def tracking_open(path, mode="r", *args, **kwargs):
+        if "w" in mode:
+            writes.append(path)
+        return real_open(path, mode, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+
+    settings_module.save_settings({"language": "tr"})
+    assert writes == []
+
+    settings_module.save_settings({"language": "en"})
+    assert len(writes) == 1
+    assert settings_module.load_settings() == {"language": "en"}
+
+
+def test_save_settings_replaces_file_atomically(settings_module, tmp_path):
+    settings_module.save_settings({"language": "en"})
+    settings_module.save_settings({"language": "tr"})
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["settings.json"]
+    assert settings_module.load_settings() == {"language": "tr"}
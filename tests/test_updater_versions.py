@@ -70,3 +70,56 @@ def test_version_comparison_with_typeerror_fallback(monkeypatch, updater_module)
     assert is_not_newer("v5.1.3", "5.1.3")
     assert not is_not_newer("v5.2.0", "5.1.3")
     assert is_not_newer("v5.1.3-beta", "5.1.3")
+
+
+class _FakeResponse:
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, _url, timeout=None, headers=None):
+        self.sent_headers.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+def test_check_for_updates_reuses_cached_release_on_304(updater_module):
+    release = {"tag_name": "v999.0.0", "html_url": "https://example.invalid/r", "body": "notes", "assets": []}
+    session = _FakeSession([
+        _FakeResponse(200, release, {"ETag": '"abc"'}),
+        _FakeResponse(304),
+    ])
+    cache = {}
+
+    first = updater_module.check_for_updates(session=session, cache=cache)
+    second = updater_module.check_for_updates(session=session, cache=cache)
+
+    assert first == second
+    assert first["version"] == "999.0.0"
+    assert session.sent_headers == [{}, {"If-None-Match": '"abc"'}]
+
+
+class _FailingSession:
+    def get(self, _url, timeout=None, headers=None):
+        raise ConnectionError("offline")
+
+
+def test_check_for_updates_failure_is_distinguishable_from_no_update(updater_module):
+    cache = {"etag": '"abc"', "release": {"tag_name": "v999.0.0"}}
+
+    assert updater_module.check_for_updates(session=_FailingSession(), cache=cache) is None
+    with pytest.raises(ConnectionError):
+        updater_module.check_for_updates(session=_FailingSession(), cache=cache, raise_errors=True)
+    assert cache == {"etag": '"abc"', "release": {"tag_name": "v999.0.0"}}